@@ -3,11 +3,24 @@ Example of using get_surface_irradiation_components to analyze solar radiation
 components for different orientations.
 """
 
+from pathlib import Path
+
 import pandas as pd
 from climate_utils import load_epw_with_location, get_surface_irradiation_components
 
+# Example settings. Set EXPORT_CSV to False when adapting this script into a
+# batch driver to skip the CSV write-out.
+ORIENTATIONS = [0, 90, 180, 270]  # N, E, S, W
+COMPONENTS = ("direct", "sky_diffuse", "ground_diffuse", "global")
+EXPORT_CSV = True
+CSV_PATH = "solar_components_july1.csv"
+
 # Load EPW data with location information
-epw_file = "../tests/San_Francisco_Intl_Ap_724940_TMY3.epw"
+epw_file = (
+    Path(__file__).parent.parent
+    / "tests"
+    / "USA_CA_San.Francisco.Intl.AP.724940_TMYx.epw"
+)
 df_epw, lat, lon, tz = load_epw_with_location(epw_file)
 
 print(f"Location: {lat:.2f}°N, {lon:.2f}°W, UTC{tz:+g}")
@@ -15,7 +28,7 @@ print(f"Location: {lat:.2f}°N, {lon:.2f}°W, UTC{tz:+g}")
 # Calculate solar components for cardinal directions
 components = get_surface_irradiation_components(
     df_epw,
-    orientations=[0, 90, 180, 270],  # N, E, S, W
+    orientations=ORIENTATIONS,
     surface_tilt=90.0,  # Vertical surfaces
     albedo=0.2,
     latitude=lat,
@@ -24,32 +37,46 @@ components = get_surface_irradiation_components(
     sky_model='haydavies'
 )
 
+# Pull each component column out once as a NumPy array so per-timestamp
+# lookups are plain integer indexing
+component_arrays = {
+    orientation: {
+        component: components[f"{orientation}_{component}"].to_numpy()
+        for component in COMPONENTS
+    }
+    for orientation in ORIENTATIONS
+}
+direction_names = {0: "North", 90: "East", 180: "South", 270: "West"}
+
 # Print sample data for a specific day (July 1st at noon)
-sample_date = '2023-07-01 12:00:00'
+sample_date = pd.Timestamp('2023-07-01 12:00:00')
 if sample_date in components.index:
+    sample_idx = components.index.get_loc(sample_date)
     print(f"\nSolar radiation components for {sample_date}:")
     print("-" * 60)
     
-    for orientation in [0, 90, 180, 270]:
-        direction = {0: "North", 90: "East", 180: "South", 270: "West"}[orientation]
+    for orientation in ORIENTATIONS:
+        direction = direction_names.get(orientation, f"{orientation}°")
+        values = component_arrays[orientation]
         print(f"\n{direction} ({orientation}°):")
-        print(f"  Direct:        {components.loc[sample_date, f'{orientation}_direct']:.1f} W/m²")
-        print(f"  Sky diffuse:   {components.loc[sample_date, f'{orientation}_sky_diffuse']:.1f} W/m²")
-        print(f"  Ground diffuse: {components.loc[sample_date, f'{orientation}_ground_diffuse']:.1f} W/m²")
-        print(f"  Global:        {components.loc[sample_date, f'{orientation}_global']:.1f} W/m²")
+        print(f"  Direct:        {values['direct'][sample_idx]:.1f} W/m²")
+        print(f"  Sky diffuse:   {values['sky_diffuse'][sample_idx]:.1f} W/m²")
+        print(f"  Ground diffuse: {values['ground_diffuse'][sample_idx]:.1f} W/m²")
+        print(f"  Global:        {values['global'][sample_idx]:.1f} W/m²")
 
 # Calculate annual totals
 print("\nAnnual radiation totals (kWh/m²):")
 print("-" * 60)
 
-for orientation in [0, 90, 180, 270]:
-    direction = {0: "North", 90: "East", 180: "South", 270: "West"}[orientation]
+for orientation in ORIENTATIONS:
+    direction = direction_names.get(orientation, f"{orientation}°")
+    values = component_arrays[orientation]
     
     # Convert from Wh to kWh
-    annual_direct = components[f'{orientation}_direct'].sum() / 1000
-    annual_sky = components[f'{orientation}_sky_diffuse'].sum() / 1000
-    annual_ground = components[f'{orientation}_ground_diffuse'].sum() / 1000
-    annual_global = components[f'{orientation}_global'].sum() / 1000
+    annual_direct = values['direct'].sum() / 1000
+    annual_sky = values['sky_diffuse'].sum() / 1000
+    annual_ground = values['ground_diffuse'].sum() / 1000
+    annual_global = values['global'].sum() / 1000
     
     print(f"\n{direction} ({orientation}°):")
     print(f"  Direct:        {annual_direct:7.1f} kWh/m² ({annual_direct/annual_global*100:4.1f}%)")
@@ -84,8 +111,9 @@ for model, sky_total in model_results.items():
     print(f"{model:12s}: {sky_total:7.1f} kWh/m² sky diffuse")
 
 # Export sample hourly data
-print("\nExporting sample data to CSV...")
-sample_data = components[['0_global', '90_global', '180_global', '270_global']].loc['2023-07-01']
-sample_data.columns = ['North', 'East', 'South', 'West']
-sample_data.to_csv('solar_components_july1.csv')
-print("Saved to solar_components_july1.csv")
\ No newline at end of file
+if EXPORT_CSV:
+    print("\nExporting sample data to CSV...")
+    sample_data = components[[f"{o}_global" for o in ORIENTATIONS]].loc['2023-07-01']
+    sample_data.columns = [direction_names.get(o, f"{o}°") for o in ORIENTATIONS]
+    sample_data.to_csv(CSV_PATH, float_format='%.3f')
+    print(f"Saved to {CSV_PATH}")
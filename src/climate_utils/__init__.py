@@ -3,42 +3,71 @@ Climate Utils - Shared utilities for climate data processing and weather file ma
 
 This package provides essential utilities for working with climate data, weather files,
 and environmental analysis.
+
+Submodules and the convenience functions below are imported lazily on first
+access (PEP 562), so ``import climate_utils`` does not pull in ladybug, pvlib
+or psychrolib until they are actually needed.
 """
 
+import importlib
+from typing import Any, List
+
 __version__ = "0.1.0"
 
-# Import all modules for direct access
-from . import epw, wind, solar, state_point, wind_analysis, types, psychrometrics_utils
-
-# Import commonly used functions for convenience
-from .epw import (
-    load_epw,
-    load_epw_to_df,
-    load_epw_with_location,
-    epw_to_df,
-    get_epw_location_info,
-    get_epw_datetime_index,
-    create_blank_epw,
-    update_epw_column,
-)
-from .wind import adjust_wind_speed, map_wind_direction_to_sector
-from .solar import get_surface_irradiation_orientations_epw, get_surface_irradiation_components
-from .state_point import StatePoint, create_state_point_from_epw
-from .wind_analysis import (
-    adjust_wind_speed_height,
-    calculate_wind_rose_data,
-    calculate_wind_statistics,
-    analyze_wind_resource,
+# Submodules available as package attributes
+_SUBMODULES = (
+    "epw",
+    "wind",
+    "solar",
+    "state_point",
+    "wind_analysis",
+    "types",
+    "psychrometrics_utils",
 )
 
-__all__ = [
-    # Modules
-    "epw", "wind", "solar", "state_point", "wind_analysis", "types", "psychrometrics_utils",
-    # Common functions
-    "load_epw", "load_epw_to_df", "load_epw_with_location", "epw_to_df",
-    "get_epw_location_info", "get_epw_datetime_index", "create_blank_epw", "update_epw_column",
-    "adjust_wind_speed", "map_wind_direction_to_sector",
-    "get_surface_irradiation_orientations_epw", "get_surface_irradiation_components",
-    "StatePoint", "create_state_point_from_epw",
-    "adjust_wind_speed_height", "calculate_wind_rose_data", "calculate_wind_statistics", "analyze_wind_resource",
-]
+# Commonly used functions, mapped to the submodule that defines them
+_LAZY_ATTRIBUTES = {
+    "load_epw": "epw",
+    "load_epw_to_df": "epw",
+    "load_epw_with_location": "epw",
+    "load_epws_to_dfs": "epw",
+    "epw_to_df": "epw",
+    "get_epw_location_info": "epw",
+    "get_epw_datetime_index": "epw",
+    "create_blank_epw": "epw",
+    "update_epw_column": "epw",
+    "adjust_wind_speed": "wind",
+    "map_wind_direction_to_sector": "wind",
+    "get_surface_irradiation_orientations_epw": "solar",
+    "get_surface_irradiation_components": "solar",
+    "StatePoint": "state_point",
+    "create_state_point_from_epw": "state_point",
+    "adjust_wind_speed_height": "wind_analysis",
+    "calculate_wind_rose_data": "wind_analysis",
+    "calculate_wind_statistics": "wind_analysis",
+    "analyze_wind_resource": "wind_analysis",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import submodules and convenience functions on first access."""
+    if name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List lazily importable names alongside the loaded ones."""
+    return sorted(list(globals()) + list(_SUBMODULES) + list(_LAZY_ATTRIBUTES))
+
+
+# Single source of truth for the public API: everything resolvable lazily
+__all__ = [*_SUBMODULES, *_LAZY_ATTRIBUTES]
@@ -5,17 +5,54 @@ This module provides functions for loading, parsing, and manipulating
 EPW weather files for climate analysis.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
+import numpy as np
 import pandas as pd
-from typing import Optional, Union, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Union, Tuple
 
 # Required imports
-from ladybug.epw import EPW
+from ladybug.epw import EPW, EPWFields
 
-from .psychrometrics_utils import series_humidity_ratio, series_enthalpy_air
+from .psychrometrics_utils import _humidity_ratio_and_enthalpy
 
 from . import wind
 
+# EPW field numbers (0-based position in a data row) of the columns returned
+# by epw_to_df, in output order. See docs/epw_file_structure.md.
+EPW_COLUMN_FIELDS = {
+    "Dry Bulb Temperature (°C)": 6,
+    "Dew Point Temperature (°C)": 7,
+    "Relative Humidity (%)": 8,
+    "Atmospheric Pressure (Pa)": 9,
+    "Global Horizontal Radiation (Wh/m²)": 13,
+    "Direct Normal Radiation (Wh/m²)": 14,
+    "Diffuse Horizontal Radiation (Wh/m²)": 15,
+    "Wind Direction (°)": 20,
+    "Wind Speed (m/s)": 21,
+    "Sky Cover (Total) (tenths)": 22,
+    "Sky Cover (Opaque) (tenths)": 23,
+    "Precipitable Water (mm)": 28,
+    "Snow Depth (cm)": 30,
+    "Visibility (km)": 24,
+    "Ceiling Height (m)": 25,
+}
+
+# Columns required to derive humidity ratio and enthalpy
+_PSYCHROMETRIC_INPUTS = (
+    "Dry Bulb Temperature (°C)",
+    "Relative Humidity (%)",
+    "Atmospheric Pressure (Pa)",
+)
+
+# Number of header lines before the hourly data block
+_EPW_HEADER_LINES = 8
+
+# Labels for the north/south split stored in the "2 Sector" column
+TWO_SECTOR_LABELS = ("N", "S")
+
 
 def load_epw(epw_file_path):
     """
@@ -37,7 +74,9 @@ def load_epw(epw_file_path):
         raise FileNotFoundError(f"EPW file not found: {epw_file_path}")
 
     epw = EPW(epw_file_path)
-    epw._import_data()
+    # Parse the file once up front; skip if ladybug has already loaded it
+    if not getattr(epw, "_is_data_loaded", False):
+        epw._import_data()
     return epw
 
 
@@ -65,6 +104,16 @@ def get_epw_location_info(epw: EPW) -> Tuple[float, float, int]:
         raise ValueError("Could not extract location information from EPW file")
 
 
+@lru_cache(maxsize=8)
+def _datetime_index_for_year(year: int) -> pd.DatetimeIndex:
+    """Build (and memoize) the hourly datetime index spanning a calendar year."""
+    return pd.date_range(
+        start=pd.Timestamp(year=year, month=1, day=1, hour=0),
+        end=pd.Timestamp(year=year, month=12, day=31, hour=23),
+        freq="h",
+    )
+
+
 def get_epw_datetime_index(epw: EPW, year: Optional[int] = None) -> pd.DatetimeIndex:
     """
     Create a proper datetime index from EPW data.
@@ -80,21 +129,21 @@ def get_epw_datetime_index(epw: EPW, year: Optional[int] = None) -> pd.DatetimeI
     Returns:
     --------
     pd.DatetimeIndex
-        Datetime index for the EPW data
+        Datetime index for the EPW data. The values are cached per year; each
+        call returns a shallow copy so metadata such as ``name`` is not shared.
     """
     # Use specified year or default to 2023 for TMY files
     if year is None:
         year = 2023
 
-    # Create datetime index for the entire year (8760 hours)
-    # EPW files typically have hourly data for the entire year
-    start_date = pd.Timestamp(year=year, month=1, day=1, hour=0)
-    end_date = pd.Timestamp(year=year, month=12, day=31, hour=23)
+    # Create datetime index for the entire year (8760 hours, 8784 in leap
+    # years, which then fail the length check against the 8760-hour data)
+    return _datetime_index_for_year(year).copy()
 
-    return pd.date_range(start=start_date, end=end_date, freq="h")
 
-
-def epw_to_df(epw, year: Optional[int] = None):
+def epw_to_df(
+    epw: EPW, year: Optional[int] = None, columns: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
     """
     Load an EPW file and return a processed DataFrame with
     - Select columns from the EPW file
@@ -109,57 +158,141 @@ def epw_to_df(epw, year: Optional[int] = None):
     year : int, optional
         Year to use for the datetime index. If None, uses 2023 as default.
         TMY files use fictional years, so this allows specifying a realistic year.
+    columns : Sequence[str], optional
+        Subset of EPW data columns (keys of ``EPW_COLUMN_FIELDS``) to load. If
+        None, all columns are loaded. Humidity ratio and enthalpy are only
+        added when dry bulb temperature, relative humidity and pressure are all
+        requested; the sector columns only when wind direction is requested.
     """
-    # Extract relevant data columns
-    data = {
-        "Dry Bulb Temperature (°C)": epw.dry_bulb_temperature,
-        "Dew Point Temperature (°C)": epw.dew_point_temperature,
-        "Relative Humidity (%)": epw.relative_humidity,
-        "Atmospheric Pressure (Pa)": epw.atmospheric_station_pressure,
-        "Global Horizontal Radiation (Wh/m²)": epw.global_horizontal_radiation,
-        "Direct Normal Radiation (Wh/m²)": epw.direct_normal_radiation,
-        "Diffuse Horizontal Radiation (Wh/m²)": epw.diffuse_horizontal_radiation,
-        "Wind Direction (°)": epw.wind_direction,
-        "Wind Speed (m/s)": epw.wind_speed,
-        "Sky Cover (Total) (tenths)": epw.total_sky_cover,
-        "Sky Cover (Opaque) (tenths)": epw.opaque_sky_cover,
-        "Precipitable Water (mm)": epw.precipitable_water,
-        "Snow Depth (cm)": epw.snow_depth,
-        "Visibility (km)": epw.visibility,
-        "Ceiling Height (m)": epw.ceiling_height,
-    }
-
-    # Create a DataFrame
-    df = pd.DataFrame(data)
-
-    assert (
-        df["Relative Humidity (%)"].between(0, 100).all()
-    ), f"Invalid RH values found:\n{df[~df['Relative Humidity (%)'].between(0, 100)]}"
-
-    # Compute psychrometric properties
-    df["Humidity Ratio (g/kg)"] = series_humidity_ratio(
-        df["Dry Bulb Temperature (°C)"],
-        df["Relative Humidity (%)"],
-        df["Atmospheric Pressure (Pa)"],
-    )
-    df["Enthalpy (J/kg)"] = series_enthalpy_air(
-        df["Dry Bulb Temperature (°C)"],
-        df["Relative Humidity (%)"],
-        df["Atmospheric Pressure (Pa)"],
-    )
+    fields = _resolve_epw_columns(columns)
+
+    # Copy every collection's underlying values tuple into one preallocated
+    # 2-D buffer so the DataFrame is backed by a single float block
+    n_hours = len(epw.dry_bulb_temperature)
+    values = np.empty((n_hours, len(fields)), dtype=np.float64)
+    for i, field_number in enumerate(fields.values()):
+        values[:, i] = np.asarray(
+            epw.get_data_by_field(field_number).values, dtype=np.float64
+        )
 
-    df["Sector"] = wind.map_wind_direction_to_sector(df["Wind Direction (°)"], 16)
+    return _epw_values_to_df(values, fields, year=year)
+
+
+def _resolve_epw_columns(columns: Optional[Sequence[str]]) -> Dict[str, int]:
+    """Map requested DataFrame column names to their EPW field numbers."""
+    if columns is None:
+        return EPW_COLUMN_FIELDS
+
+    unknown = [name for name in columns if name not in EPW_COLUMN_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown EPW columns: {unknown}. Choose from: {list(EPW_COLUMN_FIELDS)}"
+        )
+    return {name: EPW_COLUMN_FIELDS[name] for name in columns}
+
+
+def _epw_values_to_df(
+    values: np.ndarray, fields: Dict[str, int], year: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Build the processed EPW DataFrame from raw field values.
 
-    df["2 Sector"] = df["Wind Direction (°)"].apply(
-        lambda x: "N" if (x > 270 or x < 90) else "S"
+    ``values`` is an (hours, fields) float array whose columns follow
+    ``fields``. Shared by the ladybug and fast-read loaders.
+    """
+    # Create a DataFrame, indexed by the (cached) datetime index up front
+    df = pd.DataFrame(
+        values,
+        columns=list(fields),
+        index=get_epw_datetime_index(None, year=year),
+        copy=False,
     )
 
-    # Set datetime index from actual EPW data
-    df.index = get_epw_datetime_index(epw, year=year)
+    if "Relative Humidity (%)" in fields:
+        # Validate RH on the raw array (missing values are invalid too); only
+        # build the report on failure
+        rh = df["Relative Humidity (%)"].to_numpy()
+        valid = (rh >= 0.0) & (rh <= 100.0)
+        if not valid.all():
+            invalid_rows = df.loc[~valid]
+            raise ValueError(f"Invalid RH values found:\n{invalid_rows}")
+
+    if all(name in fields for name in _PSYCHROMETRIC_INPUTS):
+        # Compute psychrometric properties in one fused pass over the raw arrays
+        humidity_ratio, enthalpy = _humidity_ratio_and_enthalpy(
+            df["Dry Bulb Temperature (°C)"].to_numpy(),
+            df["Relative Humidity (%)"].to_numpy(),
+            df["Atmospheric Pressure (Pa)"].to_numpy(),
+        )
+        df["Humidity Ratio (g/kg)"] = humidity_ratio
+        df["Enthalpy (J/kg)"] = enthalpy
+
+    if "Wind Direction (°)" in fields:
+        df["Sector"] = wind.map_wind_direction_to_sector(df["Wind Direction (°)"], 16)
+
+        # Store the 2-sector split as a categorical (int8 codes into ("N", "S"))
+        wind_direction = df["Wind Direction (°)"].to_numpy()
+        north = (wind_direction > 270) | (wind_direction < 90)
+        df["2 Sector"] = pd.Categorical.from_codes(
+            np.where(north, 0, 1).astype(np.int8), categories=TWO_SECTOR_LABELS
+        )
 
     return df
 
 
+def _read_epw_fast(
+    epw_file_path: Union[str, Path], fields: Dict[str, int] = EPW_COLUMN_FIELDS
+) -> Tuple[np.ndarray, float, float, float]:
+    """
+    Read EPW data columns and location with ``pd.read_csv``, bypassing ladybug.
+
+    The returned values match ``epw_to_df``'s ladybug path exactly: integer
+    fields are rounded and point-in-time fields (temperatures, humidity, wind)
+    have the last hour moved to the front, as ladybug does on import.
+
+    Returns:
+    --------
+    Tuple[np.ndarray, float, float, float]
+        (values, latitude, longitude, timezone_offset)
+    """
+    epw_file_path = Path(epw_file_path)
+
+    if not epw_file_path.exists():
+        raise FileNotFoundError(f"EPW file not found: {epw_file_path}")
+
+    # Only the LOCATION line of the 8-line header is needed
+    with open(epw_file_path, encoding="utf-8", errors="ignore") as epw_file:
+        header = list(islice(epw_file, _EPW_HEADER_LINES))
+    location = header[0].strip().split(",")
+    try:
+        latitude, longitude, timezone_offset = (float(x) for x in location[6:9])
+    except ValueError:
+        raise ValueError("Could not extract location information from EPW file")
+
+    field_numbers = list(fields.values())
+    raw = pd.read_csv(
+        epw_file_path,
+        skiprows=_EPW_HEADER_LINES,
+        header=None,
+        usecols=field_numbers,
+        dtype=np.float64,
+        engine="c",
+        encoding_errors="ignore",
+    )
+    # Copy explicitly: under copy-on-write a single column comes back as a
+    # read-only view, and the fixups below edit the array in place
+    values = raw[field_numbers].to_numpy(dtype=np.float64, copy=True)
+
+    for i, field_number in enumerate(field_numbers):
+        field = EPWFields.field_by_number(field_number)
+        if field.value_type is int:
+            values[:, i] = np.round(values[:, i])
+        if field.name.point_in_time:
+            values[:, i] = np.roll(values[:, i], 1)
+
+    return values, latitude, longitude, timezone_offset
+
+
 def create_blank_epw() -> EPW:
     """
     Creates a blank EPW object with zeroed-out weather data and default flags.
@@ -180,16 +313,18 @@ COMMENTS 2,"All data values set to zero."
 DATA PERIODS,1,1,Data,Sunday,1/1,12/31
 """
 
-    # Generate 8760 lines of blank hourly data
-    for hour in range(1, 8761):  # EPW uses 1-based hour indexing
-        raw_epw_template += (
-            f"1999,1,1,{hour%24+1},0,"  # Year, Month, Day, Hour, Minute
-            "0,"  # Data Source and Uncertainty Flags
-            "0.0,0.0,0,"  # Dry Bulb Temp (°C), Dew Point Temp (°C), Rel. Humidity (%)
-            "101325,"  # Atmospheric Pressure (Pa)
-            "0,0,0,0,0,0,0,0,0,0,"  # Radiation & Illuminance values
-            "0,0.0,0,0,0,77777,9,999999999,0,0.000,0,0,0.000,0.0,0.0\n"  # Wind, Precip, and Flags
-        )
+    # Generate 8760 lines of blank hourly data. Only the hour field varies and
+    # it cycles with a period of 24, so build one day of lines and repeat it.
+    daily_lines = [
+        f"1999,1,1,{hour%24+1},0,"  # Year, Month, Day, Hour, Minute
+        "0,"  # Data Source and Uncertainty Flags
+        "0.0,0.0,0,"  # Dry Bulb Temp (°C), Dew Point Temp (°C), Rel. Humidity (%)
+        "101325,"  # Atmospheric Pressure (Pa)
+        "0,0,0,0,0,0,0,0,0,0,"  # Radiation & Illuminance values
+        "0,0.0,0,0,0,77777,9,999999999,0,0.000,0,0,0.000,0.0,0.0\n"  # Wind, Precip, and Flags
+        for hour in range(1, 25)  # EPW uses 1-based hour indexing
+    ]
+    raw_epw_template += "".join(daily_lines * 365)
 
     # Convert the raw string into an EPW object
     epw = EPW.from_file_string(raw_epw_template)
@@ -197,6 +332,12 @@ DATA PERIODS,1,1,Data,Sunday,1/1,12/31
     return epw
 
 
+@lru_cache(maxsize=None)
+def _epw_column_indices(num_fields: int) -> Dict[str, int]:
+    """Map EPW data type names to their position in ``EPW._data``."""
+    return {str(EPWFields.field_by_number(i).name): i for i in range(num_fields)}
+
+
 def update_epw_column(epw: EPW, column_name: str, data_series: pd.Series) -> EPW:
     """
     Updates a specific data column in an EPW object with values from a pandas Series.
@@ -204,7 +345,7 @@ def update_epw_column(epw: EPW, column_name: str, data_series: pd.Series) -> EPW
     Args:
         epw (EPW): The EPW object to be updated.
         column_name (str): The exact EPW weather parameter name (e.g., "Dry Bulb Temperature").
-        data_series (pd.Series): A pandas Series containing the new data values.
+        data_series (pd.Series): A pandas Series (or 1-D array) containing the new data values.
 
     Returns:
         EPW: The updated EPW object.
@@ -213,28 +354,34 @@ def update_epw_column(epw: EPW, column_name: str, data_series: pd.Series) -> EPW
     # Ensure the data_series has exactly 8760 values
     if len(data_series) != 8760:
         raise ValueError(
-            "The data_series must contain exactly 8760 values, you provided {len(data_series)}."
+            f"The data_series must contain exactly 8760 values, you provided {len(data_series)}."
         )
 
-    # Get the list of valid column names from epw._data
-    valid_columns = [str(dataset.header.data_type) for dataset in epw._data]
+    # Look up the column position in the (fixed) EPW field layout
+    column_indices = _epw_column_indices(len(epw._data))
+    column_index = column_indices.get(column_name)
 
     # Validate that the requested column exists
-    if column_name not in valid_columns:
+    if column_index is None:
         raise ValueError(
-            f"'{column_name}' is not a valid EPW column. Choose from: {valid_columns}"
+            f"'{column_name}' is not a valid EPW column. Choose from: {list(column_indices)}"
         )
 
-    # Find the index of the requested column
-    column_index = valid_columns.index(column_name)
-
     # Update the EPW column data
-    epw._data[column_index].values = data_series.tolist()
+    # ladybug's values setter always copies into a list, so convert the raw
+    # buffer once in C; tolist() yields plain Python scalars rather than
+    # boxed NumPy scalars that would leak into the EPW collections
+    epw._data[column_index].values = np.asarray(data_series).tolist()
 
     return epw
 
 
-def load_epw_to_df(epw_file_path, year: Optional[int] = None):
+def load_epw_to_df(
+    epw_file_path,
+    year: Optional[int] = None,
+    backend: str = "ladybug",
+    columns: Optional[Sequence[str]] = None,
+):
     """
     Load an EPW file and return a processed DataFrame with
     - Select columns from the EPW file
@@ -249,13 +396,30 @@ def load_epw_to_df(epw_file_path, year: Optional[int] = None):
     year : int, optional
         Year to use for the datetime index. If None, uses 2023 as default.
         TMY files use fictional years, so this allows specifying a realistic year.
+    backend : str, default "ladybug"
+        "ladybug" parses the file with ladybug's EPW reader. "fast" reads the
+        data block with ``pd.read_csv`` and produces the same DataFrame; use it
+        for batch loads where the ladybug EPW object is not needed.
+    columns : Sequence[str], optional
+        Subset of EPW data columns to load; see ``epw_to_df``.
     """
+    if backend == "fast":
+        fields = _resolve_epw_columns(columns)
+        values, _, _, _ = _read_epw_fast(epw_file_path, fields)
+        return _epw_values_to_df(values, fields, year=year)
+    _check_backend(backend)
+
     epw = load_epw(epw_file_path)
-    df = epw_to_df(epw, year=year)
+    df = epw_to_df(epw, year=year, columns=columns)
     return df
 
 
-def load_epw_with_location(epw_file_path, year: Optional[int] = None):
+def load_epw_with_location(
+    epw_file_path,
+    year: Optional[int] = None,
+    backend: str = "ladybug",
+    columns: Optional[Sequence[str]] = None,
+):
     """
     Load an EPW file and return both the DataFrame and location information.
 
@@ -266,13 +430,78 @@ def load_epw_with_location(epw_file_path, year: Optional[int] = None):
     year : int, optional
         Year to use for the datetime index. If None, uses 2023 as default.
         TMY files use fictional years, so this allows specifying a realistic year.
+    backend : str, default "ladybug"
+        "ladybug" or "fast"; see ``load_epw_to_df``.
+    columns : Sequence[str], optional
+        Subset of EPW data columns to load; see ``epw_to_df``.
 
     Returns:
     --------
     Tuple[pd.DataFrame, float, float, int]
         (DataFrame, latitude, longitude, timezone_offset)
     """
+    if backend == "fast":
+        fields = _resolve_epw_columns(columns)
+        values, latitude, longitude, timezone_offset = _read_epw_fast(
+            epw_file_path, fields
+        )
+        df = _epw_values_to_df(values, fields, year=year)
+        return df, latitude, longitude, timezone_offset
+    _check_backend(backend)
+
     epw = load_epw(epw_file_path)
-    df = epw_to_df(epw, year=year)
+    df = epw_to_df(epw, year=year, columns=columns)
     latitude, longitude, timezone_offset = get_epw_location_info(epw)
     return df, latitude, longitude, timezone_offset
+
+
+def load_epws_to_dfs(
+    epw_file_paths: Iterable,
+    year: Optional[int] = None,
+    backend: str = "ladybug",
+    max_workers: Optional[int] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> List[pd.DataFrame]:
+    """
+    Load several EPW files in parallel and return their processed DataFrames.
+
+    Each file is parsed and processed independently with ``load_epw_to_df`` in
+    a separate worker process, so batch loads scale with the number of cores.
+
+    Parameters:
+    -----------
+    epw_file_paths : iterable of str or Path
+        Paths to the EPW files
+    year : int, optional
+        Year to use for the datetime index. If None, uses 2023 as default.
+    backend : str, default "ladybug"
+        "ladybug" or "fast"; see ``load_epw_to_df``.
+    max_workers : int, optional
+        Number of worker processes. If None, uses the number of CPUs.
+    columns : Sequence[str], optional
+        Subset of EPW data columns to load; see ``epw_to_df``.
+
+    Returns:
+    --------
+    List[pd.DataFrame]
+        DataFrames in the same order as ``epw_file_paths``
+    """
+    _check_backend(backend)
+    _resolve_epw_columns(columns)  # fail fast, before starting the workers
+    paths = [str(path) for path in epw_file_paths]
+    if columns is not None:
+        columns = list(columns)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                partial(load_epw_to_df, year=year, backend=backend, columns=columns),
+                paths,
+            )
+        )
+
+
+def _check_backend(backend: str) -> None:
+    """Validate the ``backend`` argument of the EPW loaders."""
+    if backend not in ("ladybug", "fast"):
+        raise ValueError(f"backend must be 'ladybug' or 'fast', got {backend!r}")
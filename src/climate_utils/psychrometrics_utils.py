@@ -5,15 +5,138 @@ This module provides functions for calculating psychrometric properties
 using the psychrolib library.
 """
 
+import numpy as np
 import pandas as pd
 import psychrolib
+from typing import Optional, Tuple, Union
 
 # Set unit system to SI
 psychrolib.SetUnitSystem(psychrolib.SI)
 
 
+def _saturation_vapor_pressure(dry_bulb_temp: np.ndarray) -> np.ndarray:
+    """
+    Vectorized saturation vapor pressure (Pa) over ice/liquid water.
+
+    Array version of ``psychrolib.GetSatVapPres`` (SI), ASHRAE Handbook -
+    Fundamentals (2017) ch. 1 eqn 5 & 6, split at the triple point of water.
+    """
+    if np.any((dry_bulb_temp < -100) | (dry_bulb_temp > 200)):
+        raise ValueError("Dry bulb temperature must be in range [-100, 200]°C")
+
+    t = dry_bulb_temp + psychrolib.ZERO_CELSIUS_AS_KELVIN
+    ln_t = np.log(t)
+    ln_pws_ice = (
+        -5.6745359e03 / t
+        + 6.3925247
+        - 9.677843e-03 * t
+        + 6.2215701e-07 * t**2
+        + 2.0747825e-09 * t**3
+        - 9.484024e-13 * t**4
+        + 4.1635019 * ln_t
+    )
+    ln_pws_liquid = (
+        -5.8002206e03 / t
+        + 1.3914993
+        - 4.8640239e-02 * t
+        + 4.1764768e-05 * t**2
+        - 1.4452093e-08 * t**3
+        + 6.5459673 * ln_t
+    )
+    return np.exp(
+        np.where(
+            dry_bulb_temp <= psychrolib.TRIPLE_POINT_WATER_SI,
+            ln_pws_ice,
+            ln_pws_liquid,
+        )
+    )
+
+
+def _humidity_ratio_array(
+    dry_bulb_temp: np.ndarray,
+    rel_humidity: np.ndarray,
+    pressure: Union[np.ndarray, float],
+) -> np.ndarray:
+    """
+    Vectorized humidity ratio (kg/kg) from relative humidity in percent (0-100).
+
+    Array version of ``psychrolib.GetHumRatioFromRelHum`` (SI); ``pressure``
+    may be an array or a scalar that broadcasts against the temperatures.
+    """
+    rh_fraction = rel_humidity / 100.0
+    if np.any((rh_fraction < 0) | (rh_fraction > 1)):
+        raise ValueError("Relative humidity is outside range [0, 1]")
+
+    vapor_pressure = rh_fraction * _saturation_vapor_pressure(dry_bulb_temp)
+    return np.maximum(
+        0.621945 * vapor_pressure / (pressure - vapor_pressure),
+        psychrolib.MIN_HUM_RATIO,
+    )
+
+
+def _humidity_ratio_and_enthalpy(
+    dry_bulb_temp: np.ndarray,
+    rel_humidity: np.ndarray,
+    pressure: Union[np.ndarray, float],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fused humidity ratio (g/kg) and moist air enthalpy (J/kg) calculation.
+
+    Array version of ``psychrolib.GetHumRatioFromRelHum`` followed by
+    ``psychrolib.GetMoistAirEnthalpy``; the saturation pressure and humidity
+    ratio are computed once and shared by both outputs. Relative humidity is
+    given in percent (0-100).
+    """
+    humidity_ratio = _humidity_ratio_array(dry_bulb_temp, rel_humidity, pressure)
+    enthalpy = (
+        1.006 * dry_bulb_temp + humidity_ratio * (2501.0 + 1.86 * dry_bulb_temp)
+    ) * 1000
+
+    return humidity_ratio * 1000, enthalpy
+
+
+def _series_inputs(
+    dry_bulb_temp: pd.Series,
+    rel_humidity: pd.Series,
+    pressure: Optional[Union[pd.Series, np.ndarray, float]],
+) -> Tuple[np.ndarray, np.ndarray, Union[np.ndarray, float]]:
+    """
+    Convert Series inputs to float arrays aligned on the temperature index.
+
+    A missing pressure defaults to 101325 Pa; scalars and arrays are passed
+    through so they broadcast in the kernels instead of being expanded to a
+    Series.
+    """
+    pressure_values: Union[np.ndarray, float]
+    if pressure is None:
+        # If pressure is None, use default atmospheric pressure
+        pressure_values = 101325.0
+    elif isinstance(pressure, pd.Series):
+        pressure_values = pressure.reindex(dry_bulb_temp.index).to_numpy(
+            dtype=np.float64
+        )
+    elif isinstance(pressure, np.ndarray):
+        # Let NumPy check the shape instead of expanding to a Series
+        pressure_values = np.asarray(pressure, dtype=np.float64)
+        np.broadcast_shapes(pressure_values.shape, dry_bulb_temp.shape)
+    elif isinstance(pressure, (int, float, np.number)):
+        pressure_values = float(pressure)
+    else:
+        raise TypeError(
+            "pressure must be a Pandas Series, ndarray, int, float, or None."
+        )
+
+    return (
+        dry_bulb_temp.to_numpy(dtype=np.float64),
+        rel_humidity.reindex(dry_bulb_temp.index).to_numpy(dtype=np.float64),
+        pressure_values,
+    )
+
+
 def series_humidity_ratio(
-    dry_bulb_temp: pd.Series, rel_humidity: pd.Series, pressure: pd.Series = None
+    dry_bulb_temp: pd.Series,
+    rel_humidity: pd.Series,
+    pressure: Optional[Union[pd.Series, np.ndarray, float]] = None,
 ) -> pd.Series:
     """
     Calculate the humidity ratio (g/kg) given dry-bulb temperature (°C), relative humidity (%),
@@ -25,7 +148,7 @@ def series_humidity_ratio(
         Dry bulb temperature in Celsius
     rel_humidity : pd.Series
         Relative humidity in percentage (0-100)
-    pressure : pd.Series, optional
+    pressure : pd.Series, np.ndarray or float, optional
         Atmospheric pressure in Pascals. Defaults to 101325 Pa.
 
     Returns:
@@ -38,36 +161,18 @@ def series_humidity_ratio(
     ):
         raise TypeError("dry_bulb_temp and rel_humidity must be Pandas Series.")
 
-    # Convert RH from % to fraction
-    rh_fraction = rel_humidity / 100.0
-
-    # If pressure is None, use default atmospheric pressure
-    if pressure is None:
-        pressure = pd.Series(101325, index=dry_bulb_temp.index)  # Default pressure
-
-    if isinstance(
-        pressure, (int, float)
-    ):  # If pressure is a scalar, convert to a Series
-        pressure = pd.Series(pressure, index=dry_bulb_temp.index)
-
-    if not isinstance(pressure, pd.Series):
-        raise TypeError("pressure must be a Pandas Series, int, float, or None.")
-
-    # Apply psychrolib function row-wise
-    humidity_ratio_kg_per_kg = dry_bulb_temp.index.to_series().apply(
-        lambda idx: psychrolib.GetHumRatioFromRelHum(
-            dry_bulb_temp.loc[idx], rh_fraction.loc[idx], pressure.loc[idx]
-        )
+    humidity_ratio_kg_per_kg = _humidity_ratio_array(
+        *_series_inputs(dry_bulb_temp, rel_humidity, pressure)
     )
 
     # Convert kg/kg to g/kg
-    humidity_ratio_g_per_kg = humidity_ratio_kg_per_kg * 1000
-
-    return humidity_ratio_g_per_kg
+    return pd.Series(humidity_ratio_kg_per_kg * 1000, index=dry_bulb_temp.index)
 
 
 def series_enthalpy_air(
-    dry_bulb_temp: pd.Series, rel_humidity: pd.Series, pressure: pd.Series = None
+    dry_bulb_temp: pd.Series,
+    rel_humidity: pd.Series,
+    pressure: Optional[Union[pd.Series, np.ndarray, float]] = None,
 ) -> pd.Series:
     """
     Calculate the enthalpy of moist air (J/kg) given dry-bulb temperature (°C), relative humidity (%),
@@ -79,7 +184,7 @@ def series_enthalpy_air(
         Dry bulb temperature in Celsius
     rel_humidity : pd.Series
         Relative humidity in percentage (0-100)
-    pressure : pd.Series, optional
+    pressure : pd.Series, np.ndarray or float, optional
         Atmospheric pressure in Pascals. Defaults to 101325 Pa.
 
     Returns:
@@ -92,29 +197,8 @@ def series_enthalpy_air(
     ):
         raise TypeError("dry_bulb_temp and rel_humidity must be Pandas Series.")
 
-    # Convert RH from % to fraction
-    rh_fraction = rel_humidity / 100.0
-
-    # If pressure is None, use default atmospheric pressure
-    if pressure is None:
-        pressure = pd.Series(101325, index=dry_bulb_temp.index)  # Default pressure
-
-    if isinstance(
-        pressure, (int, float)
-    ):  # If pressure is a scalar, convert to a Series
-        pressure = pd.Series(pressure, index=dry_bulb_temp.index)
-
-    if not isinstance(pressure, pd.Series):
-        raise TypeError("pressure must be a Pandas Series, int, float, or None.")
-
-    # Apply psychrolib function row-wise
-    enthalpy_j_per_kg = dry_bulb_temp.index.to_series().apply(
-        lambda idx: psychrolib.GetMoistAirEnthalpy(
-            dry_bulb_temp.loc[idx],
-            psychrolib.GetHumRatioFromRelHum(
-                dry_bulb_temp.loc[idx], rh_fraction.loc[idx], pressure.loc[idx]
-            ),
-        )
+    _, enthalpy_j_per_kg = _humidity_ratio_and_enthalpy(
+        *_series_inputs(dry_bulb_temp, rel_humidity, pressure)
     )
 
-    return enthalpy_j_per_kg
+    return pd.Series(enthalpy_j_per_kg, index=dry_bulb_temp.index)
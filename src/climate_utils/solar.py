@@ -7,14 +7,22 @@ irradiation for different orientations.
 
 import pandas as pd
 import numpy as np
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Union
-import math
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone as dt_timezone
 
 # Import pvlib for solar position calculations
 import pvlib
 from pvlib import solarposition
 
+# NREL SPA backend: pvlib's numba-compiled version when numba is installed
+# (first call pays a one-off compile), otherwise the NumPy version
+_SPA_METHOD = (
+    "nrel_numba" if importlib.util.find_spec("numba") is not None else "nrel_numpy"
+)
+
 
 def get_surface_irradiation_orientations_epw(
     df_epw: pd.DataFrame,
@@ -23,6 +31,7 @@ def get_surface_irradiation_orientations_epw(
     latitude: Optional[float] = None,
     longitude: Optional[float] = None,
     timezone: Optional[int] = None,
+    max_workers: int = 1,
 ) -> Dict[str, pd.Series]:
     """
     Calculate surface irradiation for different orientations from EPW data.
@@ -43,6 +52,10 @@ def get_surface_irradiation_orientations_epw(
         Site longitude in degrees. If None, will try to extract from EPW data
     timezone : int, optional
         Site timezone offset in hours. If None, will try to extract from EPW data
+    max_workers : int, default 1
+        Number of threads used to project the orientations. NumPy releases the
+        GIL, so values above 1 help for many orientations or long series; 1
+        runs them serially.
 
     Returns:
     --------
@@ -57,27 +70,56 @@ def get_surface_irradiation_orientations_epw(
     dhi = df_epw["Diffuse Horizontal Radiation (Wh/m²)"]
     ghi = df_epw["Global Horizontal Radiation (Wh/m²)"]
 
-    # Extract site information if not provided
+    # Extract site information if not provided: EPW location info, else defaults
+    epw_lat, epw_lon, epw_tz = getattr(
+        df_epw, "_epw_location_info", (40.0, -74.0, -5)
+    )
     if latitude is None:
-        # Try to get from EPW header or use default
-        latitude = 40.0  # Default latitude
+        latitude = epw_lat
 
     if longitude is None:
-        longitude = -74.0  # Default longitude
+        longitude = epw_lon
 
     if timezone is None:
-        timezone = -5  # Default timezone
-
-    results = {}
-
-    for orientation in orientations:
-        # Calculate surface irradiation for this orientation
-        surface_irradiation = calculate_surface_irradiation(
-            dni, dhi, ghi, orientation, latitude, longitude, timezone, albedo
+        timezone = epw_tz
+
+    # Solar position and radiation arrays are shared by all orientations.
+    # pvlib is used whenever the data has timestamps; otherwise fall back to
+    # the simplified hourly model.
+    if isinstance(df_epw.index, pd.DatetimeIndex):
+        zenith_angles, azimuth_angles = calculate_solar_angles_epw(
+            df_epw, latitude, longitude, timezone
         )
-        results[f"{orientation}°"] = surface_irradiation
+        zenith = zenith_angles.to_numpy(dtype=float)
+        azimuth = azimuth_angles.to_numpy(dtype=float)
+    else:
+        zenith, azimuth = _compute_solar_position_arrays(
+            len(dni), latitude, longitude, timezone
+        )
+    dni_arr = dni.to_numpy(dtype=float)
+    dhi_arr = dhi.to_numpy(dtype=float)
+    ghi_arr = ghi.to_numpy(dtype=float)
+    sun_terms = _sun_direction_terms(zenith, azimuth)
+
+    def project(orientation: float) -> pd.Series:
+        # Project onto the surface for this orientation
+        surface_irradiation = _project_to_surface(
+            dni_arr, dhi_arr, ghi_arr, zenith, sun_terms, orientation, albedo
+        )
+        return pd.Series(surface_irradiation, index=dni.index, copy=False)
+
+    if max_workers > 1 and len(orientations) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(orientations))
+        ) as executor:
+            projections = list(executor.map(project, orientations))
+    else:
+        projections = [project(orientation) for orientation in orientations]
 
-    return results
+    return {
+        f"{orientation}°": projection
+        for orientation, projection in zip(orientations, projections)
+    }
 
 
 def calculate_surface_irradiation(
@@ -93,6 +135,12 @@ def calculate_surface_irradiation(
     """
     Calculate surface irradiation for a specific orientation.
 
+    Projects the irradiance onto a vertical surface: direct beam from the
+    angle of incidence, isotropic sky diffuse (half the sky) and ground
+    reflection (half the ground), with irradiation zeroed while the sun is
+    below the horizon. With a DatetimeIndex the sun position comes from pvlib
+    (NREL SPA); otherwise a simplified hourly model is used.
+
     Parameters:
     -----------
     dni : pd.Series
@@ -117,129 +165,162 @@ def calculate_surface_irradiation(
     pd.Series
         Surface irradiation for the specified orientation
     """
-    # Convert angles to radians
-    lat_rad = math.radians(latitude)
-    surface_az_rad = math.radians(surface_azimuth)
+    if isinstance(dni.index, pd.DatetimeIndex):
+        zenith_angles, azimuth_angles = calculate_solar_angles_epw(
+            dni.to_frame(), latitude, longitude, timezone
+        )
+        zenith = zenith_angles.to_numpy(dtype=float)
+        azimuth = azimuth_angles.to_numpy(dtype=float)
+    else:
+        zenith, azimuth = _compute_solar_position_arrays(
+            len(dni), latitude, longitude, timezone
+        )
+    surface_irradiation = _project_to_surface(
+        dni.to_numpy(dtype=float),
+        dhi.to_numpy(dtype=float),
+        ghi.to_numpy(dtype=float),
+        zenith,
+        _sun_direction_terms(zenith, azimuth),
+        surface_azimuth,
+        albedo,
+    )
 
-    # Calculate solar position for each hour
+    # The array is freshly allocated, so wrap it without another copy
+    return pd.Series(surface_irradiation, index=dni.index, copy=False)
+
+
+def _compute_solar_position_arrays(
+    n_hours: int, latitude: float, longitude: float, timezone: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simplified solar zenith and azimuth (degrees) for hours 0..n_hours-1.
+
+    The position does not depend on the surface, so it is computed once and
+    shared by every orientation.
+    """
     # This is a simplified calculation - for more accuracy, use a proper solar position library
-    hours = range(len(dni))
-
-    surface_irradiation = pd.Series(index=dni.index, dtype=float)
-
-    for i, hour in enumerate(hours):
-        # Simplified solar position calculation
-        # In a real implementation, you'd use a proper solar position algorithm
-        solar_zenith = calculate_solar_zenith(hour, latitude, longitude, timezone)
-        solar_azimuth = calculate_solar_azimuth(hour, latitude, longitude, timezone)
-
-        if solar_zenith < 90:  # Sun is above horizon
-            # Calculate angle of incidence
-            cos_incidence = calculate_cos_incidence(
-                solar_zenith, solar_azimuth, surface_azimuth
-            )
-
-            # Direct component
-            if cos_incidence > 0:
-                direct_component = dni.iloc[i] * cos_incidence
-            else:
-                direct_component = 0
-
-            # Diffuse component (simplified isotropic model)
-            diffuse_component = (
-                dhi.iloc[i] * 0.5 * (1 + math.cos(math.radians(90)))
-            )  # Assuming vertical surface
-
-            # Reflected component
-            reflected_component = (
-                ghi.iloc[i] * albedo * 0.5 * (1 - math.cos(math.radians(90)))
-            )
-
-            surface_irradiation.iloc[i] = (
-                direct_component + diffuse_component + reflected_component
-            )
-        else:
-            surface_irradiation.iloc[i] = 0
+    hours = np.arange(n_hours)
+    zenith = calculate_solar_zenith(hours, latitude, longitude, timezone)
+    azimuth = calculate_solar_azimuth(hours, latitude, longitude, timezone)
+    return zenith, azimuth
+
+
+def _sun_direction_terms(
+    zenith: np.ndarray, azimuth: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Horizontal components of the sun direction, sin(zenith) * cos/sin(azimuth).
+
+    For a vertical surface cos(incidence) = sin(z) * cos(az - surf_az), which
+    expands to ``terms[0] * cos(surf_az) + terms[1] * sin(surf_az)``. The
+    terms depend only on the sun, so an orientation sweep evaluates the
+    per-hour trigonometry once instead of once per orientation.
+    """
+    sin_zenith = np.sin(np.radians(zenith))
+    azimuth_rad = np.radians(azimuth)
+    return sin_zenith * np.cos(azimuth_rad), sin_zenith * np.sin(azimuth_rad)
+
+
+def _project_to_surface(
+    dni: np.ndarray,
+    dhi: np.ndarray,
+    ghi: np.ndarray,
+    zenith: np.ndarray,
+    sun_terms: Tuple[np.ndarray, np.ndarray],
+    surface_azimuth: float,
+    albedo: float,
+) -> np.ndarray:
+    """Project horizontal/normal irradiance arrays onto one vertical surface."""
+    # Accumulate in place in the freshly allocated cos(incidence) array to
+    # avoid a temporary per component
+
+    # Direct component (angle of incidence clipped at zero), from the shared
+    # sun terms so only two scalar trig calls are made per orientation
+    surface_azimuth_rad = np.radians(surface_azimuth)
+    surface_irradiation = sun_terms[0] * np.cos(surface_azimuth_rad)
+    surface_irradiation += sun_terms[1] * np.sin(surface_azimuth_rad)
+    np.maximum(surface_irradiation, 0.0, out=surface_irradiation)
+    surface_irradiation *= dni
+
+    # Diffuse component (simplified isotropic model): a vertical surface
+    # sees half the sky, 0.5 * (1 + cos(90°))
+    surface_irradiation += 0.5 * dhi
+
+    # Reflected component: half the ground, 0.5 * (1 - cos(90°))
+    surface_irradiation += (0.5 * albedo) * ghi
+
+    # Zero irradiation while the sun is below the horizon
+    surface_irradiation[~(zenith < 90)] = 0.0
 
     return surface_irradiation
 
 
 def calculate_solar_zenith(
-    hour: int, latitude: float, longitude: float, timezone: int
-) -> float:
+    hour: Union[int, np.ndarray], latitude: float, longitude: float, timezone: int
+) -> Union[float, np.ndarray]:
     """
-    Calculate solar zenith angle for a given hour.
+    Calculate solar zenith angle for a given hour or array of hours.
 
     This is a simplified calculation. For accurate results, use a proper
     solar position library like pvlib.
     """
     # Simplified calculation - in practice, use pvlib or similar
     # This is just a placeholder for the basic structure
-    day_of_year = (hour // 24) + 1
-    hour_of_day = hour % 24
+    hour_of_day = np.mod(hour, 24)
 
     # Simplified solar position calculation
     # This would need to be replaced with proper astronomical calculations
-    solar_zenith = 45 + 45 * math.cos(2 * math.pi * (hour_of_day - 12) / 24)
+    solar_zenith = 45 + 45 * np.cos(2 * np.pi * (hour_of_day - 12) / 24)
 
-    return max(0, min(90, solar_zenith))
+    return np.clip(solar_zenith, 0, 90)
 
 
 def calculate_solar_azimuth(
-    hour: int, latitude: float, longitude: float, timezone: int
-) -> float:
+    hour: Union[int, np.ndarray], latitude: float, longitude: float, timezone: int
+) -> Union[float, np.ndarray]:
     """
-    Calculate solar azimuth angle for a given hour.
+    Calculate solar azimuth angle for a given hour or array of hours.
 
     This is a simplified calculation. For accurate results, use a proper
     solar position library like pvlib.
     """
     # Simplified calculation - in practice, use pvlib or similar
-    hour_of_day = hour % 24
+    hour_of_day = np.mod(hour, 24)
 
     # Simplified azimuth calculation
-    solar_azimuth = 180 + (hour_of_day - 12) * 15
-
-    return solar_azimuth % 360
+    return np.mod(180 + (hour_of_day - 12) * 15.0, 360)
 
 
 def calculate_cos_incidence(
-    solar_zenith: float, solar_azimuth: float, surface_azimuth: float
-) -> float:
+    solar_zenith: Union[float, np.ndarray],
+    solar_azimuth: Union[float, np.ndarray],
+    surface_azimuth: float,
+) -> Union[float, np.ndarray]:
     """
     Calculate cosine of angle of incidence between sun and surface.
 
     Parameters:
     -----------
-    solar_zenith : float
+    solar_zenith : float or np.ndarray
         Solar zenith angle in degrees
-    solar_azimuth : float
+    solar_azimuth : float or np.ndarray
         Solar azimuth angle in degrees
     surface_azimuth : float
         Surface azimuth angle in degrees
 
     Returns:
     --------
-    float
+    float or np.ndarray
         Cosine of angle of incidence
     """
-    # Convert to radians
-    zenith_rad = math.radians(solar_zenith)
-    solar_az_rad = math.radians(solar_azimuth)
-    surface_az_rad = math.radians(surface_azimuth)
-
-    # Calculate angle of incidence
-    cos_incidence = math.cos(zenith_rad) * math.cos(
-        math.radians(90)
-    ) + math.sin(  # Vertical surface
-        zenith_rad
-    ) * math.sin(
-        math.radians(90)
-    ) * math.cos(
-        solar_az_rad - surface_az_rad
+    # Calculate angle of incidence for a vertical surface: the cos(tilt)
+    # term vanishes and sin(tilt) is one. The azimuth difference is taken in
+    # degrees so only one radians conversion per angle is needed.
+    cos_incidence = np.sin(np.radians(solar_zenith)) * np.cos(
+        np.radians(solar_azimuth - surface_azimuth)
     )
 
-    return max(0, cos_incidence)  # Ensure non-negative
+    return np.maximum(0.0, cos_incidence)  # Ensure non-negative
 
 
 def get_surface_irradiation_components(
@@ -300,45 +381,65 @@ def get_surface_irradiation_components(
         df_epw, latitude, longitude, timezone
     )
     
-    # Initialize result DataFrame
-    result_df = pd.DataFrame(index=df_epw.index)
-    
-    # Ensure all series have the same index as the EPW data (timezone-naive)
-    # The solar position calculation returns timezone-aware indices, but we need
-    # everything to align with the EPW data index
-    zenith_angles = pd.Series(zenith_angles.values, index=df_epw.index)
-    azimuth_angles = pd.Series(azimuth_angles.values, index=df_epw.index)
-    
+    # Hours with no irradiance at all give zero for every component, except
+    # under Perez which yields NaN there, so only the lit hours are passed
+    # to pvlib and the rest are left as zeros
+    dni = dni.to_numpy(dtype=float)
+    dhi = dhi.to_numpy(dtype=float)
+    ghi = ghi.to_numpy(dtype=float)
+    dark = (dni == 0) & (dhi == 0) & (ghi == 0)
+    if sky_model.lower() != 'perez' and dark.any():
+        hours = np.flatnonzero(~dark)
+    else:
+        hours = slice(None)
+
+    # The solar position calculation returns timezone-aware indices; work on
+    # plain arrays laid out as (orientation, hour) so one pvlib call covers
+    # every orientation by broadcasting
+    zenith_angles = zenith_angles.to_numpy(dtype=float)[np.newaxis, hours]
+    azimuth_angles = azimuth_angles.to_numpy(dtype=float)[np.newaxis, hours]
+    surface_azimuths = np.asarray(orientations, dtype=float)[:, np.newaxis]
+
     # Calculate extraterrestrial DNI if needed for certain sky models
     dni_extra = None
     if sky_model.lower() in ['haydavies', 'reindl', 'perez', 'perez-driesse']:
         # Use pvlib to calculate extraterrestrial radiation
         # Use the EPW index to ensure consistency
-        dni_extra = pvlib.irradiance.get_extra_radiation(df_epw.index)
-    
-    # Calculate components for each orientation
-    for orientation in orientations:
-        # Use pvlib's get_total_irradiance
-        poa_components = pvlib.irradiance.get_total_irradiance(
-            surface_tilt=surface_tilt,
-            surface_azimuth=orientation,
-            solar_zenith=zenith_angles,
-            solar_azimuth=azimuth_angles,
-            dni=dni,
-            ghi=ghi,
-            dhi=dhi,
-            dni_extra=dni_extra,
-            albedo=albedo,
-            model=sky_model,
-        )
-        
-        # Add columns to result DataFrame
-        result_df[f'{int(orientation)}_direct'] = poa_components['poa_direct']
-        result_df[f'{int(orientation)}_sky_diffuse'] = poa_components['poa_sky_diffuse']
-        result_df[f'{int(orientation)}_ground_diffuse'] = poa_components['poa_ground_diffuse']
-        result_df[f'{int(orientation)}_global'] = poa_components['poa_global']
-        
-    return result_df
+        dni_extra = pvlib.irradiance.get_extra_radiation(
+            df_epw.index[hours]
+        ).to_numpy()[np.newaxis, :]
+
+    # Use pvlib's get_total_irradiance for all orientations at once
+    poa_components = pvlib.irradiance.get_total_irradiance(
+        surface_tilt=surface_tilt,
+        surface_azimuth=surface_azimuths,
+        solar_zenith=zenith_angles,
+        solar_azimuth=azimuth_angles,
+        dni=dni[np.newaxis, hours],
+        ghi=ghi[np.newaxis, hours],
+        dhi=dhi[np.newaxis, hours],
+        dni_extra=dni_extra,
+        albedo=albedo,
+        model=sky_model,
+    )
+
+    # Scatter the lit hours back; components that do not depend on azimuth
+    # come back with one row and broadcast over the orientations
+    shape = (len(orientations), len(df_epw.index))
+    components = {}
+    for name in ['direct', 'sky_diffuse', 'ground_diffuse', 'global']:
+        values = np.zeros(shape)
+        values[:, hours] = poa_components[f'poa_{name}']
+        components[name] = values
+
+    # Build the result DataFrame in one go
+    columns = {
+        f'{int(orientation)}_{name}': values[i]
+        for i, orientation in enumerate(orientations)
+        for name, values in components.items()
+    }
+
+    return pd.DataFrame(columns, index=df_epw.index)
 
 
 def calculate_solar_angles_epw(
@@ -403,16 +504,57 @@ def calculate_solar_angles_epw(
         )
 
     # Convert local time to UTC for pvlib calculations
-    # EPW data is typically in local time, but pvlib expects UTC
-    # Note: Etc/GMT uses opposite sign convention (Etc/GMT-8 = UTC+8)
+    # EPW data is typically in local (standard) time, but pvlib expects UTC.
+    # A fixed UTC offset also handles fractional zones such as UTC+5.5.
     local_times = df_epw.index
-    timezone_int = int(timezone)  # Convert float to int for timezone string
-    utc_times = local_times.tz_localize(
-        f"Etc/GMT{-timezone_int:+d}"
-        if timezone_int <= 0
-        else f"Etc/GMT{-timezone_int:d}"
-    ).tz_convert("UTC")
+    if local_times.tz is None:
+        local_times = local_times.tz_localize(
+            dt_timezone(timedelta(hours=float(timezone)))
+        )
+    utc_times = local_times.tz_convert("UTC")
+
+    # Evenly spaced timestamps (every EPW year) are fully described by their
+    # start, step and length, so the SPA result can be shared between frames.
+    # Temperature only affects the apparent (refracted) angles, not these.
+    # Key on nanoseconds; pandas >= 2.0 indexes may use a coarser resolution
+    if hasattr(utc_times, "as_unit"):
+        timestamps = utc_times.as_unit("ns").asi8
+    else:
+        timestamps = utc_times.asi8
+    steps = np.diff(timestamps)
+    if len(timestamps) > 1 and (steps == steps[0]).all():
+        zenith, azimuth = _regular_solar_position(
+            int(timestamps[0]),
+            int(steps[0]),
+            len(timestamps),
+            float(latitude),
+            float(longitude),
+        )
+        # The memoized arrays are shared and read-only, so copy them out
+        copy = True
+    else:
+        # Use temperature from EPW if available, as a plain array so pvlib
+        # does not realign it against the UTC timestamps
+        if "Dry Bulb Temperature (°C)" in df_epw.columns:
+            temperature = df_epw["Dry Bulb Temperature (°C)"].to_numpy(dtype=float)
+        else:
+            temperature = 20.0
+        zenith, azimuth = _solar_position(utc_times, latitude, longitude, temperature)
+        copy = False
+
+    zenith_angles = pd.Series(zenith, index=utc_times, name="zenith", copy=copy)
+    azimuth_angles = pd.Series(azimuth, index=utc_times, name="azimuth", copy=copy)
+
+    return zenith_angles, azimuth_angles
 
+
+def _solar_position(
+    utc_times: pd.DatetimeIndex,
+    latitude: float,
+    longitude: float,
+    temperature: Union[float, np.ndarray] = 20.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Solar zenith and azimuth (degrees) from pvlib's NREL SPA, clipped."""
     # Calculate solar position using pvlib
     solar_pos = solarposition.get_solarposition(
         time=utc_times,
@@ -420,22 +562,35 @@ def calculate_solar_angles_epw(
         longitude=longitude,
         altitude=0,  # Sea level
         pressure=None,  # Use standard atmosphere
-        temperature=df_epw.get(
-            "Dry Bulb Temperature (°C)", 20
-        ),  # Use temperature from EPW if available
+        temperature=temperature,
         delta_t=67.0,  # Delta T for solar position calculation
         atmos_refract=0.5667,  # Atmospheric refraction
-        method="nrel_numpy",  # Use NREL's solar position algorithm
+        method=_SPA_METHOD,  # Use NREL's solar position algorithm
     )
 
-    # Extract zenith and azimuth angles
-    zenith_angles = solar_pos["zenith"]
-    azimuth_angles = solar_pos["azimuth"]
+    # Ensure angles are within valid ranges. pvlib's columns are read-only
+    # views, so the clip itself is the single copy made of each angle.
+    zenith = np.clip(solar_pos["zenith"].to_numpy(), 0, 90)  # 0-90 degrees
+    azimuth = np.clip(solar_pos["azimuth"].to_numpy(), 0, 360)  # 0-360 degrees
 
-    # Ensure angles are within valid ranges
-    zenith_angles = zenith_angles.clip(0, 90)  # Zenith angle should be 0-90 degrees
-    azimuth_angles = azimuth_angles.clip(
-        0, 360
-    )  # Azimuth angle should be 0-360 degrees
+    return zenith, azimuth
 
-    return zenith_angles, azimuth_angles
+
+@lru_cache(maxsize=16)
+def _regular_solar_position(
+    start: int, step: int, periods: int, latitude: float, longitude: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Memoized _solar_position for evenly spaced UTC timestamps.
+
+    The timestamps are given as integer ``start`` and ``step`` in
+    nanoseconds. The cached arrays are read-only; callers copy them into
+    their Series.
+    """
+    utc_times = pd.to_datetime(
+        start + step * np.arange(periods, dtype=np.int64), unit="ns", utc=True
+    )
+    zenith, azimuth = _solar_position(utc_times, latitude, longitude)
+    zenith.flags.writeable = False
+    azimuth.flags.writeable = False
+    return zenith, azimuth
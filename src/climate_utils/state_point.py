@@ -7,8 +7,11 @@ psychrometric properties of air.
 
 import pandas as pd
 import numpy as np
-from typing import Optional, Union, Dict, Any
-import math
+from typing import Optional, Union, Dict, Any, overload
+
+# Newton iteration limits for the wet bulb temperature (Celsius)
+_WET_BULB_MAX_ITERATIONS = 20
+_WET_BULB_TOLERANCE = 1e-6
 
 
 class StatePoint:
@@ -19,26 +22,44 @@ class StatePoint:
     properties of air such as temperature, humidity, enthalpy, etc.
     """
 
+    # Fixed attribute set (inputs plus lazily filled caches); no per-instance
+    # __dict__ for the many small state points built in parameter sweeps
+    __slots__ = (
+        "_index",
+        "dry_bulb_temp",
+        "_pressure",
+        "_pressure_series",
+        "_humidity_ratio",
+        "_relative_humidity",
+        "_wet_bulb_temp",
+        "_dew_point_temp",
+        "_enthalpy",
+        "_specific_volume",
+        "_dry_bulb_pws",
+        "_pw",
+    )
+
     def __init__(
         self,
-        dry_bulb_temp: Union[float, pd.Series],
-        humidity_ratio: Optional[Union[float, pd.Series]] = None,
-        relative_humidity: Optional[Union[float, pd.Series]] = None,
-        wet_bulb_temp: Optional[Union[float, pd.Series]] = None,
-        dew_point_temp: Optional[Union[float, pd.Series]] = None,
-        pressure: Union[float, pd.Series] = 101325.0,
-        altitude: Optional[Union[float, pd.Series]] = None,
+        dry_bulb_temp: Union[float, np.ndarray, pd.Series],
+        humidity_ratio: Optional[Union[float, np.ndarray, pd.Series]] = None,
+        relative_humidity: Optional[Union[float, np.ndarray, pd.Series]] = None,
+        wet_bulb_temp: Optional[Union[float, np.ndarray, pd.Series]] = None,
+        dew_point_temp: Optional[Union[float, np.ndarray, pd.Series]] = None,
+        pressure: Union[float, np.ndarray, pd.Series] = 101325.0,
+        altitude: Optional[Union[float, np.ndarray, pd.Series]] = None,
+        index: Optional[pd.Index] = None,
     ):
         """
         Initialize a StatePoint with air properties.
 
         Parameters:
         -----------
-        dry_bulb_temp : float or pd.Series
+        dry_bulb_temp : float, np.ndarray or pd.Series
             Dry bulb temperature in Celsius
         humidity_ratio : float or pd.Series, optional
             Humidity ratio in kg/kg
-        relative_humidity : float or pd.Series, optional
+        relative_humidity : float, np.ndarray or pd.Series, optional
             Relative humidity as a fraction (0-1)
         wet_bulb_temp : float or pd.Series, optional
             Wet bulb temperature in Celsius
@@ -48,69 +69,94 @@ class StatePoint:
             Atmospheric pressure in Pa
         altitude : float or pd.Series, optional
             Altitude in meters (used to calculate pressure if not provided)
+        index : pd.Index, optional
+            Index for the property Series. Defaults to the index of
+            dry_bulb_temp, or a RangeIndex for scalars and arrays.
         """
-        # First, determine the length from dry_bulb_temp
-        if isinstance(dry_bulb_temp, pd.Series):
-            length = len(dry_bulb_temp)
-        else:
-            length = 1
+        # First, determine the index from dry_bulb_temp
+        if index is None:
+            if isinstance(dry_bulb_temp, pd.Series):
+                index = dry_bulb_temp.index
+            else:
+                index = pd.RangeIndex(max(np.size(dry_bulb_temp), 1))
+        self._index = index
+
+        self.dry_bulb_temp = self._ensure_series(dry_bulb_temp)
 
-        self.dry_bulb_temp = self._ensure_series(dry_bulb_temp, length)
-        self.pressure = self._ensure_series(pressure, length)
+        # Constant pressure stays a scalar and broadcasts in the calculations;
+        # the pressure Series is only built when requested
+        self._pressure = self._as_values(self._align(pressure))
+        self._pressure_series: Optional[pd.Series] = None
 
         # Calculate pressure from altitude if provided
         if altitude is not None:
-            altitude_series = self._ensure_series(altitude, length)
-            self.pressure = self._calculate_pressure_from_altitude(altitude_series)
-
-        # Initialize other properties
-        self._humidity_ratio = None
-        self._relative_humidity = None
-        self._wet_bulb_temp = None
-        self._dew_point_temp = None
-        self._enthalpy = None
-        self._specific_volume = None
-
-        # Set the provided properties and calculate others
+            self._pressure = self._calculate_pressure_from_altitude(
+                self._as_values(self._align(altitude))
+            )
+
+        # Initialize other properties; derived ones are computed on first
+        # access and cached
+        self._relative_humidity: Optional[pd.Series] = None
+        self._wet_bulb_temp: Optional[pd.Series] = None
+        self._dew_point_temp: Optional[pd.Series] = None
+        self._enthalpy: Optional[pd.Series] = None
+        self._specific_volume: Optional[pd.Series] = None
+        self._dry_bulb_pws: Optional[np.ndarray] = None
+        self._pw: Optional[np.ndarray] = None
+
+        # Set the humidity ratio (always assigned) and calculate others
+        self._humidity_ratio: pd.Series
         self._set_properties(
             humidity_ratio=humidity_ratio,
             relative_humidity=relative_humidity,
             wet_bulb_temp=wet_bulb_temp,
             dew_point_temp=dew_point_temp,
-            length=length,
         )
 
-    def _ensure_series(
-        self, value: Union[float, pd.Series], length: int = 1
-    ) -> pd.Series:
-        """Convert scalar to series if needed."""
+    def _ensure_series(self, value: Union[float, np.ndarray, pd.Series]) -> pd.Series:
+        """Convert scalars and arrays to a Series on the state point index."""
         if isinstance(value, pd.Series):
             return value
-        else:
-            # Use the same index as dry_bulb_temp if available
-            if hasattr(self, "dry_bulb_temp") and isinstance(
-                self.dry_bulb_temp, pd.Series
-            ):
-                return pd.Series(
-                    [value] * len(self.dry_bulb_temp), index=self.dry_bulb_temp.index
-                )
-            else:
-                return pd.Series([value] * length)
-
-    def _calculate_pressure_from_altitude(self, altitude: pd.Series) -> pd.Series:
+        if np.ndim(value) == 0:
+            return pd.Series(value, index=self._index)
+        # Arrays are wrapped without a copy
+        return pd.Series(np.asarray(value), index=self._index, copy=False)
+
+    def _align(
+        self, value: Union[float, np.ndarray, pd.Series]
+    ) -> Union[float, np.ndarray, pd.Series]:
+        """Align a Series on the state point index; other values pass through."""
+        if isinstance(value, pd.Series) and not value.index.equals(self._index):
+            return value.reindex(self._index)
+        return value
+
+    @staticmethod
+    def _as_values(
+        value: Union[float, np.ndarray, pd.Series],
+    ) -> Union[float, np.ndarray]:
+        """Return a float for scalars and a float array for Series/arrays."""
+        if isinstance(value, pd.Series):
+            return value.to_numpy(dtype=float)
+        values = np.asarray(value, dtype=float)
+        if values.ndim == 0:
+            return float(values)
+        return values
+
+    def _calculate_pressure_from_altitude(
+        self, altitude: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         """Calculate atmospheric pressure from altitude using standard atmosphere."""
         # Standard atmosphere model
         return 101325.0 * np.exp(-altitude / 7400.0)
 
     def _set_properties(
         self,
-        humidity_ratio: Optional[Union[float, pd.Series]] = None,
-        relative_humidity: Optional[Union[float, pd.Series]] = None,
-        wet_bulb_temp: Optional[Union[float, pd.Series]] = None,
-        dew_point_temp: Optional[Union[float, pd.Series]] = None,
-        length: int = 1,
-    ):
-        """Set properties and calculate dependent ones."""
+        humidity_ratio: Optional[Union[float, np.ndarray, pd.Series]] = None,
+        relative_humidity: Optional[Union[float, np.ndarray, pd.Series]] = None,
+        wet_bulb_temp: Optional[Union[float, np.ndarray, pd.Series]] = None,
+        dew_point_temp: Optional[Union[float, np.ndarray, pd.Series]] = None,
+    ) -> None:
+        """Set the humidity ratio; dependent properties are computed on access."""
         # Count how many properties are provided
         provided = sum(
             [
@@ -128,37 +174,39 @@ class StatePoint:
 
         if provided == 0:
             # Default to dry air
-            self._humidity_ratio = pd.Series(0.0, index=self.dry_bulb_temp.index)
-            self._calculate_all_properties()
+            self._humidity_ratio = pd.Series(0.0, index=self._index)
         else:
             if humidity_ratio is not None:
-                self._humidity_ratio = self._ensure_series(humidity_ratio, length)
+                self._humidity_ratio = self._ensure_series(humidity_ratio)
             elif relative_humidity is not None:
-                rh = self._ensure_series(relative_humidity, length)
-                self._humidity_ratio = self._calculate_humidity_ratio_from_rh(rh)
+                # Computed on plain values and wrapped once
+                rh = self._as_values(relative_humidity)
+                self._humidity_ratio = pd.Series(
+                    self._calculate_humidity_ratio_from_rh(rh),
+                    index=self._index,
+                    copy=False,
+                )
             elif wet_bulb_temp is not None:
-                wbt = self._ensure_series(wet_bulb_temp, length)
+                wbt = self._ensure_series(wet_bulb_temp)
                 self._humidity_ratio = self._calculate_humidity_ratio_from_wet_bulb(wbt)
             elif dew_point_temp is not None:
-                dpt = self._ensure_series(dew_point_temp, length)
+                dpt = self._ensure_series(dew_point_temp)
                 self._humidity_ratio = self._calculate_humidity_ratio_from_dew_point(
                     dpt
                 )
 
-            self._calculate_all_properties()
-
     def _calculate_humidity_ratio_from_rh(
-        self, relative_humidity: pd.Series
-    ) -> pd.Series:
+        self, relative_humidity: Union[float, np.ndarray]
+    ) -> np.ndarray:
         """Calculate humidity ratio from relative humidity."""
-        # Saturation vapor pressure at dry bulb temperature
-        pws = self._calculate_saturation_vapor_pressure(self.dry_bulb_temp)
+        # Saturation vapor pressure at dry bulb temperature (kept for reuse)
+        pws = self._dry_bulb_saturation_pressure()
 
         # Actual vapor pressure
         pw = relative_humidity * pws
 
         # Humidity ratio
-        return 0.62198 * pw / (self.pressure - pw)
+        return 0.62198 * pw / (self._pressure - pw)
 
     def _calculate_humidity_ratio_from_wet_bulb(
         self, wet_bulb_temp: pd.Series
@@ -168,7 +216,7 @@ class StatePoint:
         pws_wb = self._calculate_saturation_vapor_pressure(wet_bulb_temp)
 
         # Saturation humidity ratio at wet bulb temperature
-        ws_wb = 0.62198 * pws_wb / (self.pressure - pws_wb)
+        ws_wb = 0.62198 * pws_wb / (self._pressure - pws_wb)
 
         # Enthalpy at wet bulb temperature
         h_wb = 1.006 * wet_bulb_temp + ws_wb * (2501 + 1.86 * wet_bulb_temp)
@@ -187,53 +235,161 @@ class StatePoint:
         pws_dp = self._calculate_saturation_vapor_pressure(dew_point_temp)
 
         # Humidity ratio
-        return 0.62198 * pws_dp / (self.pressure - pws_dp)
+        return 0.62198 * pws_dp / (self._pressure - pws_dp)
 
-    def _calculate_saturation_vapor_pressure(self, temperature: pd.Series) -> pd.Series:
-        """Calculate saturation vapor pressure using Magnus formula."""
-        # Magnus formula for saturation vapor pressure (Pa)
-        return 610.78 * np.exp(17.2694 * temperature / (temperature + 238.3))
+    @overload
+    def _calculate_saturation_vapor_pressure(
+        self, temperature: pd.Series
+    ) -> pd.Series: ...
 
-    def _calculate_all_properties(self):
-        """Calculate all psychrometric properties."""
-        # Relative humidity
-        pws = self._calculate_saturation_vapor_pressure(self.dry_bulb_temp)
-        pw = self._humidity_ratio * self.pressure / (0.62198 + self._humidity_ratio)
-        self._relative_humidity = pw / pws
+    @overload
+    def _calculate_saturation_vapor_pressure(
+        self, temperature: np.ndarray
+    ) -> np.ndarray: ...
 
-        # Dew point temperature (iterative calculation simplified)
-        self._dew_point_temp = self._calculate_dew_point_temperature()
-
-        # Wet bulb temperature (iterative calculation simplified)
-        self._wet_bulb_temp = self._calculate_wet_bulb_temperature()
+    def _calculate_saturation_vapor_pressure(
+        self, temperature: Union[np.ndarray, pd.Series]
+    ) -> Union[np.ndarray, pd.Series]:
+        """Calculate saturation vapor pressure using Magnus formula."""
+        if isinstance(temperature, pd.Series):
+            return pd.Series(
+                self._calculate_saturation_vapor_pressure(
+                    temperature.to_numpy(dtype=float)
+                ),
+                index=temperature.index,
+                copy=False,
+            )
 
-        # Enthalpy
-        self._enthalpy = 1.006 * self.dry_bulb_temp + self._humidity_ratio * (
-            2501 + 1.86 * self.dry_bulb_temp
-        )
+        # Magnus formula for saturation vapor pressure (Pa):
+        # 610.78 * exp(17.2694 * T / (T + 238.3)), evaluated in place so the
+        # chain costs one temporary besides the result
+        temperature = np.asarray(temperature, dtype=float)
+        pws = np.multiply(17.2694, temperature, out=np.empty_like(temperature))
+        pws /= temperature + 238.3
+        np.exp(pws, out=pws)
+        pws *= 610.78
+        return pws
+
+    def _dry_bulb_saturation_pressure(self) -> np.ndarray:
+        """Saturation vapor pressure at the dry bulb temperature, computed once."""
+        if self._dry_bulb_pws is None:
+            self._dry_bulb_pws = self._calculate_saturation_vapor_pressure(
+                self.dry_bulb_temp.to_numpy(dtype=float)
+            )
+        return self._dry_bulb_pws
+
+    def _humidity_ratio_values(self) -> np.ndarray:
+        """Humidity ratio as a float array, positionally aligned with T."""
+        return self._humidity_ratio.to_numpy(dtype=float)
+
+    def _is_dry_air(self) -> bool:
+        """True when there is no vapor, so RH is zero and the dew point undefined."""
+        return not self._humidity_ratio_values().any()
+
+    def _vapor_pressure(self) -> np.ndarray:
+        """Partial vapor pressure (Pa) from the humidity ratio, computed once."""
+        if self._pw is None:
+            humidity_ratio = self._humidity_ratio_values()
+            pw = humidity_ratio * self._pressure
+            pw /= humidity_ratio + 0.62198
+            self._pw = pw
+        return self._pw
+
+    def _wrap(self, values: np.ndarray) -> pd.Series:
+        """Wrap a freshly computed array on the state point index."""
+        return pd.Series(values, index=self._index, copy=False)
+
+    def _calculate_relative_humidity(self) -> np.ndarray:
+        """Calculate relative humidity (fraction) from the humidity ratio."""
+        if self._is_dry_air():
+            # Dry air: skip the saturation pressure pass
+            return np.zeros(len(self._index))
+        return self._vapor_pressure() / self._dry_bulb_saturation_pressure()
+
+    def _calculate_enthalpy(self) -> np.ndarray:
+        """Calculate moist air enthalpy (kJ/kg)."""
+        dry_bulb_temp = self.dry_bulb_temp.to_numpy(dtype=float)
+
+        # Enthalpy: 1.006 * T + W * (2501 + 1.86 * T), updated in place so
+        # the property costs one output array rather than one per operation
+        enthalpy = 1.86 * dry_bulb_temp
+        enthalpy += 2501
+        enthalpy *= self._humidity_ratio_values()
+        enthalpy += 1.006 * dry_bulb_temp
+        return enthalpy
+
+    def _calculate_specific_volume(self) -> np.ndarray:
+        """Calculate moist air specific volume (m³/kg)."""
+        # Specific volume: 287.055 * (T + 273.15) * (1 + 1.6078 * W) / P
+        specific_volume = self.dry_bulb_temp.to_numpy(dtype=float) + 273.15
+        specific_volume *= 287.055
+        specific_volume *= 1 + 1.6078 * self._humidity_ratio_values()
+        specific_volume /= self._pressure
+        return specific_volume
+
+    def _calculate_dew_point_temperature(
+        self, vapor_pressure: np.ndarray
+    ) -> np.ndarray:
+        """Calculate dew point temperature from vapor pressure (Pa)."""
+        # Simplified calculation - in practice, use iterative method
+        # Inverse of Magnus formula
+        log_ratio = np.log(vapor_pressure / 610.78)
+        return 238.3 * log_ratio / (17.2694 - log_ratio)
 
-        # Specific volume
-        self._specific_volume = (
-            287.055
-            * (self.dry_bulb_temp + 273.15)
-            * (1 + 1.6078 * self._humidity_ratio)
-        ) / self.pressure
+    def _calculate_wet_bulb_temperature(
+        self, dry_bulb_temp: np.ndarray, relative_humidity: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate wet bulb temperature (Celsius) by Newton iteration.
 
-    def _calculate_dew_point_temperature(self) -> pd.Series:
-        """Calculate dew point temperature."""
-        # Simplified calculation - in practice, use iterative method
-        pw = self._humidity_ratio * self.pressure / (0.62198 + self._humidity_ratio)
+        Solves ``W(Twb) = W`` for the inverse used when a wet bulb temperature
+        is given (see ``_calculate_humidity_ratio_from_wet_bulb``), so the two
+        conversions round-trip. All points are iterated together as arrays,
+        starting from the linear approximation ``T - (1 - RH) * 5``.
+        """
+        humidity_ratio = self._humidity_ratio_values()
+        pressure = self._pressure
+        latent = 2501 + 1.86 * dry_bulb_temp
+        target = 1.006 * dry_bulb_temp + humidity_ratio * latent
+
+        wet_bulb_temp = dry_bulb_temp - (1 - relative_humidity) * 5
+        for _ in range(_WET_BULB_MAX_ITERATIONS):
+            # Saturation humidity ratio at the wet bulb and its derivative
+            pws = self._calculate_saturation_vapor_pressure(wet_bulb_temp)
+            dpws = pws * (17.2694 * 238.3) / (wet_bulb_temp + 238.3) ** 2
+            ws = 0.62198 * pws / (pressure - pws)
+            dws = 0.62198 * pressure * dpws / (pressure - pws) ** 2
+
+            # Enthalpy balance, scaled by the latent term of the inverse
+            residual = 1.006 * wet_bulb_temp + ws * (2501 + 1.86 * wet_bulb_temp)
+            residual -= target
+            slope = 1.006 + dws * (2501 + 1.86 * wet_bulb_temp) + 1.86 * ws
+
+            step = residual / slope
+            wet_bulb_temp -= step
+            if not np.nanmax(np.abs(step), initial=0.0) > _WET_BULB_TOLERANCE:
+                break
+
+        return wet_bulb_temp
 
-        # Inverse of Magnus formula
-        dew_point = 238.3 * np.log(pw / 610.78) / (17.2694 - np.log(pw / 610.78))
+    @property
+    def pressure(self) -> pd.Series:
+        """Get atmospheric pressure in Pa."""
+        if self._pressure_series is None:
+            self._pressure_series = pd.Series(
+                np.full(len(self._index), self._pressure), index=self._index
+            )
+        return self._pressure_series
 
-        return dew_point
+    @pressure.setter
+    def pressure(self, value: Union[float, pd.Series]) -> None:
+        """
+        Set the reported atmospheric pressure in Pa.
 
-    def _calculate_wet_bulb_temperature(self) -> pd.Series:
-        """Calculate wet bulb temperature."""
-        # Simplified calculation - in practice, use iterative method
-        # This is an approximation
-        return self.dry_bulb_temp - (1 - self._relative_humidity) * 5
+        Properties derived from the humidity ratio keep the pressure given at
+        construction, as they did when they were computed eagerly.
+        """
+        self._pressure_series = self._ensure_series(value)
 
     @property
     def humidity_ratio(self) -> pd.Series:
@@ -243,47 +399,71 @@ class StatePoint:
     @property
     def relative_humidity(self) -> pd.Series:
         """Get relative humidity as a fraction (0-1)."""
+        if self._relative_humidity is None:
+            self._relative_humidity = self._wrap(self._calculate_relative_humidity())
         return self._relative_humidity
 
     @property
     def wet_bulb_temp(self) -> pd.Series:
         """Get wet bulb temperature in Celsius."""
+        if self._wet_bulb_temp is None:
+            # Newton solve until every step is within tolerance or the iteration cap
+            self._wet_bulb_temp = self._wrap(
+                self._calculate_wet_bulb_temperature(
+                    self.dry_bulb_temp.to_numpy(dtype=float),
+                    self.relative_humidity.to_numpy(),
+                )
+            )
         return self._wet_bulb_temp
 
     @property
     def dew_point_temp(self) -> pd.Series:
         """Get dew point temperature in Celsius."""
+        if self._dew_point_temp is None:
+            if self._is_dry_air():
+                # Undefined without vapor; skip the log pass
+                dew_point_temp = np.full(len(self._index), np.nan)
+            else:
+                dew_point_temp = self._calculate_dew_point_temperature(
+                    self._vapor_pressure()
+                )
+            self._dew_point_temp = self._wrap(dew_point_temp)
         return self._dew_point_temp
 
     @property
     def enthalpy(self) -> pd.Series:
         """Get enthalpy in kJ/kg."""
+        if self._enthalpy is None:
+            self._enthalpy = self._wrap(self._calculate_enthalpy())
         return self._enthalpy
 
     @property
     def specific_volume(self) -> pd.Series:
         """Get specific volume in m³/kg."""
+        if self._specific_volume is None:
+            self._specific_volume = self._wrap(self._calculate_specific_volume())
         return self._specific_volume
 
     def to_dataframe(self) -> pd.DataFrame:
-        """Convert state point to DataFrame."""
+        """Convert state point to DataFrame, computing every property."""
         return pd.DataFrame(
             {
                 "dry_bulb_temp": self.dry_bulb_temp,
                 "humidity_ratio": self._humidity_ratio,
-                "relative_humidity": self._relative_humidity,
-                "wet_bulb_temp": self._wet_bulb_temp,
-                "dew_point_temp": self._dew_point_temp,
-                "enthalpy": self._enthalpy,
-                "specific_volume": self._specific_volume,
+                "relative_humidity": self.relative_humidity,
+                "wet_bulb_temp": self.wet_bulb_temp,
+                "dew_point_temp": self.dew_point_temp,
+                "enthalpy": self.enthalpy,
+                "specific_volume": self.specific_volume,
                 "pressure": self.pressure,
-            }
+            },
+            index=self._index,
         )
 
     def __repr__(self) -> str:
         """String representation of the StatePoint."""
         if len(self.dry_bulb_temp) == 1:
-            return f"StatePoint(T={self.dry_bulb_temp.iloc[0]:.1f}°C, RH={self._relative_humidity.iloc[0]*100:.1f}%)"
+            return f"StatePoint(T={self.dry_bulb_temp.iloc[0]:.1f}°C, RH={self.relative_humidity.iloc[0]*100:.1f}%)"
         else:
             return f"StatePoint({len(self.dry_bulb_temp)} points, T={self.dry_bulb_temp.mean():.1f}°C avg)"
 
@@ -302,12 +482,18 @@ def create_state_point_from_epw(df_epw: pd.DataFrame) -> StatePoint:
     StatePoint
         StatePoint object with psychrometric properties
     """
-    # Extract data directly using exact column names
-    dry_bulb_temp = df_epw["Dry Bulb Temperature (°C)"]
-    relative_humidity = df_epw["Relative Humidity (%)"]
-
-    # Convert relative humidity to fraction if in percentage
-    if relative_humidity.max() > 1:
+    # Extract data directly using exact column names, as plain arrays so the
+    # psychrometric chain skips index alignment; the index is attached once
+    dry_bulb_temp = df_epw["Dry Bulb Temperature (°C)"].to_numpy(dtype=float)
+    relative_humidity = df_epw["Relative Humidity (%)"].to_numpy(dtype=float)
+
+    # Convert relative humidity to fraction if in percentage; nanmax skips
+    # missing values like Series.max() did
+    if np.nanmax(relative_humidity, initial=-np.inf) > 1:
         relative_humidity = relative_humidity / 100
 
-    return StatePoint(dry_bulb_temp=dry_bulb_temp, relative_humidity=relative_humidity)
+    return StatePoint(
+        dry_bulb_temp=dry_bulb_temp,
+        relative_humidity=relative_humidity,
+        index=df_epw.index,
+    )
@@ -5,7 +5,9 @@ This module defines TypedDict structures for DataFrame columns and other data ty
 used throughout the package to ensure type safety and documentation.
 """
 
-from typing import TypedDict, Union, Literal
+from __future__ import annotations
+
+from typing import Optional, Sequence, TypedDict, Union, Literal
 import pandas as pd
 
 
@@ -57,29 +59,30 @@ EPWDataFrame = TypedDict(
 )
 
 
-# Required columns for different analysis types
+# Required columns for different analysis types. Values are immutable tuples so
+# the shared definitions cannot be modified by callers.
 REQUIRED_EPW_COLUMNS = {
-    "basic": [
+    "basic": (
         "Dry Bulb Temperature (°C)",
         "Relative Humidity (%)",
         "Wind Speed (m/s)",
         "Wind Direction (°)",
-    ],
-    "solar": [
+    ),
+    "solar": (
         "Direct Normal Radiation (Wh/m²)",
         "Diffuse Horizontal Radiation (Wh/m²)",
         "Global Horizontal Radiation (Wh/m²)",
-    ],
-    "psychrometric": [
+    ),
+    "psychrometric": (
         "Dry Bulb Temperature (°C)",
         "Relative Humidity (%)",
         "Atmospheric Station Pressure (Pa)",
-    ],
-    "wind_analysis": [
+    ),
+    "wind_analysis": (
         "Wind Speed (m/s)",
         "Wind Direction (°)",
-    ],
-    "complete": [
+    ),
+    "complete": (
         "Year",
         "Month",
         "Day",
@@ -106,7 +109,7 @@ REQUIRED_EPW_COLUMNS = {
         "Albedo (unitless)",
         "Liquid Precipitation Depth (mm)",
         "Liquid Precipitation Quantity (hr)",
-    ],
+    ),
 }
 
 
@@ -142,14 +145,14 @@ EPWDataFramePsychrometric = TypedDict(
 
 # Validation functions
 def validate_epw_dataframe(
-    df: pd.DataFrame, required_columns: list[str] = None
+    df: pd.DataFrame, required_columns: Optional[Sequence[str]] = None
 ) -> None:
     """
     Validate that a DataFrame has the required EPW columns.
 
     Args:
         df: DataFrame to validate
-        required_columns: List of required column names. If None, uses 'basic' columns.
+        required_columns: Sequence of required column names. If None, uses 'basic' columns.
 
     Raises:
         ValueError: If required columns are missing
@@ -161,7 +164,9 @@ def validate_epw_dataframe(
     if required_columns is None:
         required_columns = REQUIRED_EPW_COLUMNS["basic"]
 
-    missing_columns = [col for col in required_columns if col not in df.columns]
+    # Hash the available columns once so each membership check is O(1)
+    available_columns = set(df.columns)
+    missing_columns = [col for col in required_columns if col not in available_columns]
 
     if missing_columns:
         raise ValueError(
@@ -170,90 +175,95 @@ def validate_epw_dataframe(
         )
 
 
-def get_epw_column_info() -> dict[str, dict[str, str]]:
+# Column descriptions served by get_epw_column_info; built once at import
+_EPW_COLUMN_INFO: dict[str, dict[str, Union[str, bool]]] = {
+    "Dry Bulb Temperature (°C)": {
+        "description": "Ambient air temperature",
+        "unit": "°C",
+        "type": "float",
+        "required": True,
+    },
+    "Relative Humidity (%)": {
+        "description": "Relative humidity as percentage",
+        "unit": "%",
+        "type": "float",
+        "required": True,
+    },
+    "Wind Speed (m/s)": {
+        "description": "Wind speed at measurement height",
+        "unit": "m/s",
+        "type": "float",
+        "required": True,
+    },
+    "Wind Direction (°)": {
+        "description": "Wind direction in degrees from north",
+        "unit": "°",
+        "type": "float",
+        "required": True,
+    },
+    "Direct Normal Radiation (Wh/m²)": {
+        "description": "Direct normal solar radiation",
+        "unit": "Wh/m²",
+        "type": "float",
+        "required": False,
+    },
+    "Diffuse Horizontal Radiation (Wh/m²)": {
+        "description": "Diffuse horizontal solar radiation",
+        "unit": "Wh/m²",
+        "type": "float",
+        "required": False,
+    },
+    "Global Horizontal Radiation (Wh/m²)": {
+        "description": "Global horizontal solar radiation",
+        "unit": "Wh/m²",
+        "type": "float",
+        "required": False,
+    },
+    "Atmospheric Station Pressure (Pa)": {
+        "description": "Atmospheric pressure at station",
+        "unit": "Pa",
+        "type": "float",
+        "required": False,
+    },
+    "Humidity Ratio (kg/kg)": {
+        "description": "Calculated humidity ratio",
+        "unit": "kg/kg",
+        "type": "float",
+        "required": False,
+    },
+    "Enthalpy (kJ/kg)": {
+        "description": "Calculated air enthalpy",
+        "unit": "kJ/kg",
+        "type": "float",
+        "required": False,
+    },
+    "Wet Bulb Temperature (°C)": {
+        "description": "Calculated wet bulb temperature",
+        "unit": "°C",
+        "type": "float",
+        "required": False,
+    },
+    "Specific Volume (m³/kg)": {
+        "description": "Calculated specific volume",
+        "unit": "m³/kg",
+        "type": "float",
+        "required": False,
+    },
+    "Wind Direction Sector": {
+        "description": "Wind direction mapped to compass sector",
+        "unit": "sector number",
+        "type": "int",
+        "required": False,
+    },
+}
+
+
+def get_epw_column_info() -> dict[str, dict[str, Union[str, bool]]]:
     """
     Get information about EPW DataFrame columns.
 
     Returns:
         Dictionary mapping column names to their descriptions and units.
+        Each call returns a fresh copy that callers may modify.
     """
-    return {
-        "Dry Bulb Temperature (°C)": {
-            "description": "Ambient air temperature",
-            "unit": "°C",
-            "type": "float",
-            "required": True,
-        },
-        "Relative Humidity (%)": {
-            "description": "Relative humidity as percentage",
-            "unit": "%",
-            "type": "float",
-            "required": True,
-        },
-        "Wind Speed (m/s)": {
-            "description": "Wind speed at measurement height",
-            "unit": "m/s",
-            "type": "float",
-            "required": True,
-        },
-        "Wind Direction (°)": {
-            "description": "Wind direction in degrees from north",
-            "unit": "°",
-            "type": "float",
-            "required": True,
-        },
-        "Direct Normal Radiation (Wh/m²)": {
-            "description": "Direct normal solar radiation",
-            "unit": "Wh/m²",
-            "type": "float",
-            "required": False,
-        },
-        "Diffuse Horizontal Radiation (Wh/m²)": {
-            "description": "Diffuse horizontal solar radiation",
-            "unit": "Wh/m²",
-            "type": "float",
-            "required": False,
-        },
-        "Global Horizontal Radiation (Wh/m²)": {
-            "description": "Global horizontal solar radiation",
-            "unit": "Wh/m²",
-            "type": "float",
-            "required": False,
-        },
-        "Atmospheric Station Pressure (Pa)": {
-            "description": "Atmospheric pressure at station",
-            "unit": "Pa",
-            "type": "float",
-            "required": False,
-        },
-        "Humidity Ratio (kg/kg)": {
-            "description": "Calculated humidity ratio",
-            "unit": "kg/kg",
-            "type": "float",
-            "required": False,
-        },
-        "Enthalpy (kJ/kg)": {
-            "description": "Calculated air enthalpy",
-            "unit": "kJ/kg",
-            "type": "float",
-            "required": False,
-        },
-        "Wet Bulb Temperature (°C)": {
-            "description": "Calculated wet bulb temperature",
-            "unit": "°C",
-            "type": "float",
-            "required": False,
-        },
-        "Specific Volume (m³/kg)": {
-            "description": "Calculated specific volume",
-            "unit": "m³/kg",
-            "type": "float",
-            "required": False,
-        },
-        "Wind Direction Sector": {
-            "description": "Wind direction mapped to compass sector",
-            "unit": "sector number",
-            "type": "int",
-            "required": False,
-        },
-    }
+    return {column: dict(info) for column, info in _EPW_COLUMN_INFO.items()}
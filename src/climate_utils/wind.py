@@ -9,6 +9,34 @@ import pandas as pd
 import numpy as np
 from typing import Union
 
+# Compass sector labels, stored once as categorical dtypes so each call only
+# computes codes
+_SECTOR_DTYPES = {
+    num_sectors: pd.CategoricalDtype(labels)
+    for num_sectors, labels in {
+        16: [
+            "N",
+            "NNE",
+            "NE",
+            "ENE",
+            "E",
+            "ESE",
+            "SE",
+            "SSE",
+            "S",
+            "SSW",
+            "SW",
+            "WSW",
+            "W",
+            "WNW",
+            "NW",
+            "NNW",
+        ],
+        8: ["N", "NE", "E", "SE", "S", "SW", "W", "NW"],
+        4: ["N", "E", "S", "W"],
+    }.items()
+}
+
 
 def adjust_wind_speed(
     wind_speed: Union[float, pd.Series],
@@ -41,6 +69,13 @@ def adjust_wind_speed(
     if shear_coef is None:
         raise ValueError("Shear coefficient must be provided for wind speed adjustment")
 
+    if new_height == ref_height:
+        # Same height: nothing to scale. Series get a shallow copy that shares
+        # the data instead of a new array
+        if isinstance(wind_speed, pd.Series):
+            return wind_speed.copy(deep=False)
+        return wind_speed
+
     return wind_speed * ((new_height / ref_height) ** shear_coef)
 
 
@@ -58,44 +93,22 @@ def map_wind_direction_to_sector(series_wind_direction, num_sectors=16):
     if not isinstance(series_wind_direction, pd.Series):
         raise TypeError("Input must be a pandas Series.")
 
-    if num_sectors not in [4, 8, 16]:
+    if num_sectors not in _SECTOR_DTYPES:
         raise ValueError("num_sectors must be one of [4, 8, 16].")
 
-    sector_labels = {
-        16: [
-            "N",
-            "NNE",
-            "NE",
-            "ENE",
-            "E",
-            "ESE",
-            "SE",
-            "SSE",
-            "S",
-            "SSW",
-            "SW",
-            "WSW",
-            "W",
-            "WNW",
-            "NW",
-            "NNW",
-        ],
-        8: ["N", "NE", "E", "SE", "S", "SW", "W", "NW"],
-        4: ["N", "E", "S", "W"],
-    }[num_sectors]
-
+    # Nearest-sector index: sector i is centred on i * sector_width, so shifting
+    # by half a sector and flooring maps e.g. 350° back onto "N"
     sector_width = 360 / num_sectors
-    sector_edges = np.linspace(
-        -sector_width / 2, 360 - sector_width / 2, num_sectors + 1
-    )
-    sector_edges[-1] = 360  # Ensure wrap-around for 360 degrees
-
-    return pd.cut(
-        series_wind_direction % 360,
-        bins=sector_edges,
-        labels=sector_labels,
-        right=False,
-        include_lowest=True,
+    directions = series_wind_direction.to_numpy(dtype=np.float64)
+    missing = np.isnan(directions)
+    codes = np.floor(np.where(missing, 0.0, directions) / sector_width + 0.5)
+    codes = codes.astype(np.int64) % num_sectors
+    codes[missing] = -1  # Categorical code for NaN
+
+    return pd.Series(
+        pd.Categorical.from_codes(codes, dtype=_SECTOR_DTYPES[num_sectors]),
+        index=series_wind_direction.index,
+        name=series_wind_direction.name,
     )
 
 
@@ -10,6 +10,33 @@ import numpy as np
 from typing import Dict, List, Optional, Tuple, Union
 import math
 
+# Standard compass sector names, stored once as categorical dtypes
+_COMPASS_SECTOR_DTYPES = {
+    num_sectors: pd.CategoricalDtype(list(names))
+    for num_sectors, names in {
+        16: (
+            "N",
+            "NNE",
+            "NE",
+            "ENE",
+            "E",
+            "ESE",
+            "SE",
+            "SSE",
+            "S",
+            "SSW",
+            "SW",
+            "WSW",
+            "W",
+            "WNW",
+            "NW",
+            "NNW",
+        ),
+        8: ("N", "NE", "E", "SE", "S", "SW", "W", "NW"),
+        4: ("N", "E", "S", "W"),
+    }.items()
+}
+
 
 def adjust_wind_speed_height(
     wind_speed: Union[float, pd.Series],
@@ -48,11 +75,20 @@ def adjust_wind_speed_height(
     float or pd.Series
         Wind speed adjusted to target height
     """
+    # The logarithmic profile needs both heights above the roughness length
     if surface_roughness is not None:
-        # Use logarithmic wind profile
         if from_height <= surface_roughness or to_height <= surface_roughness:
             raise ValueError("Height must be greater than surface roughness length")
 
+    if from_height == to_height:
+        # Same height: nothing to scale. Series get a shallow copy that shares
+        # the data instead of a new array
+        if isinstance(wind_speed, pd.Series):
+            return wind_speed.copy(deep=False)
+        return wind_speed
+
+    if surface_roughness is not None:
+        # Use logarithmic wind profile
         adjusted_speed = wind_speed * (
             np.log(to_height / surface_roughness)
             / np.log(from_height / surface_roughness)
@@ -86,30 +122,12 @@ def map_wind_direction_to_sector(
     str or pd.Series
         Sector name(s) for the wind direction(s)
     """
+    sector_dtype = None
     if sector_names is None:
-        if num_sectors == 16:
-            sector_names = [
-                "N",
-                "NNE",
-                "NE",
-                "ENE",
-                "E",
-                "ESE",
-                "SE",
-                "SSE",
-                "S",
-                "SSW",
-                "SW",
-                "WSW",
-                "W",
-                "WNW",
-                "NW",
-                "NNW",
-            ]
-        elif num_sectors == 8:
-            sector_names = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
-        elif num_sectors == 4:
-            sector_names = ["N", "E", "S", "W"]
+        if num_sectors in _COMPASS_SECTOR_DTYPES:
+            # Standard compass directions, with a shared categorical dtype
+            sector_dtype = _COMPASS_SECTOR_DTYPES[num_sectors]
+            sector_names = list(sector_dtype.categories)
         else:
             sector_names = [f"Sector_{i}" for i in range(num_sectors)]
 
@@ -118,21 +136,47 @@ def map_wind_direction_to_sector(
             f"Number of sector names ({len(sector_names)}) must match num_sectors ({num_sectors})"
         )
 
-    # Normalize wind direction to 0-360
-    normalized_direction = wind_direction % 360
-
-    # Calculate sector index
+    # Calculate sector size
     sector_size = 360 / num_sectors
-    sector_index = (normalized_direction / sector_size).astype(int)
-
-    # Handle edge case where direction is exactly 360 degrees
-    sector_index = sector_index % num_sectors
 
     if isinstance(wind_direction, pd.Series):
+        # Normalize wind direction to 0-360 and calculate sector index on the
+        # raw values; missing directions get no sector
+        normalized_direction = np.mod(wind_direction.to_numpy(dtype=np.float64), 360.0)
+        valid = np.isfinite(normalized_direction)
+        sector_index = np.zeros(len(normalized_direction), dtype=np.int64)
+        sector_index[valid] = (normalized_direction[valid] / sector_size).astype(
+            np.int64
+        )
+
+        # Handle edge case where direction is exactly 360 degrees
+        sector_index %= num_sectors
+
+        # Gather the labels as categorical codes, so the name vocabulary is
+        # stored once and grouping by sector works on integer codes. Custom
+        # names may repeat, so their sector indices are mapped onto the
+        # unique names first.
+        if sector_dtype is None:
+            categories = pd.Index(sector_names).unique()
+            sector_dtype = pd.CategoricalDtype(categories)
+            codes = categories.get_indexer(sector_names)[sector_index]
+        else:
+            codes = sector_index
+        codes[~valid] = -1
         return pd.Series(
-            [sector_names[i] for i in sector_index], index=wind_direction.index
+            pd.Categorical.from_codes(codes, dtype=sector_dtype),
+            index=wind_direction.index,
         )
     else:
+        # Single direction: plain float arithmetic; a missing one has no sector
+        normalized_direction = float(wind_direction) % 360
+        if np.isnan(normalized_direction):
+            return np.nan
+
+        # Calculate sector index; the modulo handles directions that round
+        # up to exactly 360 degrees
+        sector_index = int(normalized_direction / sector_size) % num_sectors
+
         return sector_names[sector_index]
 
 
@@ -166,37 +210,43 @@ def calculate_wind_rose_data(
 
     # Create direction sectors
     direction_sectors = map_wind_direction_to_sector(wind_direction, direction_bins)
-
-    # Create speed bins
-    speed_categories = pd.cut(
-        wind_speed, bins=speed_bins, labels=False, include_lowest=True
+    sector_codes = direction_sectors.cat.codes.to_numpy(dtype=np.int64)
+    sectors = direction_sectors.cat.categories
+
+    # Create speed bins, closed on the right with the lowest edge included
+    # (as pd.cut(..., include_lowest=True)); out-of-range speeds get no bin
+    speeds = wind_speed.to_numpy(dtype=np.float64)
+    edges = np.asarray(speed_bins, dtype=np.float64)
+    n_speed_bins = len(edges) - 1
+    speed_index = np.searchsorted(edges, speeds, side="left") - 1
+    speed_index[speeds == edges[0]] = 0
+
+    # Calculate frequencies as a 2-D histogram over (sector, speed bin) pairs,
+    # keeping only the observed combinations
+    valid = (sector_codes >= 0) & (speed_index >= 0) & (speed_index < n_speed_bins)
+    counts = np.bincount(
+        sector_codes[valid] * n_speed_bins + speed_index[valid],
+        minlength=len(sectors) * n_speed_bins,
     )
-
-    # Create combined DataFrame
-    wind_data = pd.DataFrame(
+    observed = np.flatnonzero(counts)
+    wind_rose = pd.DataFrame(
         {
-            "wind_speed": wind_speed,
-            "wind_direction": wind_direction,
-            "direction_sector": direction_sectors,
-            "speed_bin": speed_categories,
+            "direction_sector": pd.Categorical.from_codes(
+                observed // n_speed_bins, sectors
+            ),
+            "speed_bin": observed % n_speed_bins,
+            "count": counts[observed],
         }
     )
+    wind_rose["frequency"] = wind_rose["count"] / len(wind_speed) * 100
 
-    # Calculate frequencies
-    wind_rose = (
-        wind_data.groupby(["direction_sector", "speed_bin"])
-        .size()
-        .reset_index(name="count")
-    )
-    wind_rose["frequency"] = wind_rose["count"] / len(wind_data) * 100
-
-    # Add speed bin labels
-    speed_labels = [
-        f"{speed_bins[i]}-{speed_bins[i+1]}" for i in range(len(speed_bins) - 1)
-    ]
-    wind_rose["speed_label"] = wind_rose["speed_bin"].map(
-        lambda x: speed_labels[x] if pd.notna(x) else "Missing"
+    # Add speed bin labels; every counted speed has a bin, so the labels are
+    # gathered by bin index
+    speed_labels = np.array(
+        [f"{speed_bins[i]}-{speed_bins[i+1]}" for i in range(n_speed_bins)],
+        dtype=object,
     )
+    wind_rose["speed_label"] = speed_labels[wind_rose["speed_bin"].to_numpy()]
 
     return wind_rose
 
@@ -214,7 +264,8 @@ def calculate_wind_statistics(
     wind_direction : pd.Series
         Wind direction data in degrees
     time_period : str, optional
-        Time period for grouping (e.g., 'D' for daily, 'M' for monthly)
+        Time period for grouping (e.g., 'D' for daily, 'ME' for monthly;
+        use 'M' on pandas < 2.2). Requires the data to have a DatetimeIndex.
 
     Returns:
     --------
@@ -227,23 +278,57 @@ def calculate_wind_statistics(
             {"wind_speed": wind_speed, "wind_direction": wind_direction}
         )
 
-        # Add time index if not present
+        # Periods are only meaningful on real timestamps; an assumed calendar
+        # would shift the period boundaries for any other year
         if not isinstance(wind_data.index, pd.DatetimeIndex):
-            wind_data.index = pd.date_range(
-                start="2020-01-01", periods=len(wind_data), freq="H"
+            raise ValueError(
+                "Grouping by time_period requires wind data with a DatetimeIndex"
             )
 
-        # Group and calculate statistics
-        grouped = wind_data.groupby(pd.Grouper(freq=time_period))
+        # Remove missing values, then add the direction unit vector and calm
+        # flag so every statistic is a plain per-period aggregation
+        wind_data = wind_data.dropna()
+        direction_rad = np.radians(wind_data["wind_direction"].to_numpy(dtype=float))
+        wind_data = wind_data.assign(
+            u=np.cos(direction_rad),
+            v=np.sin(direction_rad),
+            calm=(wind_data["wind_speed"] < 0.5).astype(float),
+        )
+
+        # Group and calculate statistics for all periods at once
+        grouped = wind_data.groupby(pd.Grouper(freq=time_period)).agg(
+            mean_speed=("wind_speed", "mean"),
+            max_speed=("wind_speed", "max"),
+            min_speed=("wind_speed", "min"),
+            std_speed=("wind_speed", "std"),
+            median_speed=("wind_speed", "median"),
+            u=("u", "mean"),
+            v=("v", "mean"),
+            calm=("calm", "mean"),
+            data_count=("wind_speed", "size"),
+        )
+        grouped = grouped[grouped["data_count"] > 0]
+
+        mean_direction, std_direction = _circular_mean_and_std(
+            grouped["u"].to_numpy(), grouped["v"].to_numpy()
+        )
+        period_columns = {
+            "mean_speed": grouped["mean_speed"].to_numpy(),
+            "max_speed": grouped["max_speed"].to_numpy(),
+            "min_speed": grouped["min_speed"].to_numpy(),
+            "std_speed": grouped["std_speed"].to_numpy(),
+            "median_speed": grouped["median_speed"].to_numpy(),
+            "mean_direction": mean_direction,
+            "std_direction": std_direction,
+            "calm_percentage": grouped["calm"].to_numpy() * 100,
+            "data_count": grouped["data_count"].tolist(),
+        }
 
+        # Flatten to "{period}_{statistic}" keys
         stats = {}
-        for name, group in grouped:
-            if len(group) > 0:
-                period_stats = _calculate_single_period_stats(
-                    group["wind_speed"], group["wind_direction"]
-                )
-                for key, value in period_stats.items():
-                    stats[f"{name}_{key}"] = value
+        for i, name in enumerate(grouped.index):
+            for key, values in period_columns.items():
+                stats[f"{name}_{key}"] = values[i]
     else:
         stats = _calculate_single_period_stats(wind_speed, wind_direction)
 
@@ -254,67 +339,67 @@ def _calculate_single_period_stats(
     wind_speed: pd.Series, wind_direction: pd.Series
 ) -> Dict[str, float]:
     """Calculate wind statistics for a single time period."""
+    # Work on float arrays converted once, skipping Series dispatch
+    speed = wind_speed.to_numpy(dtype=np.float64)
+    direction = wind_direction.to_numpy(dtype=np.float64)
+
     # Remove missing values
-    valid_mask = wind_speed.notna() & wind_direction.notna()
-    wind_speed_clean = wind_speed[valid_mask]
-    wind_direction_clean = wind_direction[valid_mask]
+    valid_mask = ~(np.isnan(speed) | np.isnan(direction))
+    speed = speed[valid_mask]
+    direction = direction[valid_mask]
+    count = len(speed)
 
-    if len(wind_speed_clean) == 0:
+    if count == 0:
         return {}
 
+    mean_direction, std_direction = _calculate_direction_stats(direction)
+
+    # Count calm hours directly instead of averaging a boolean Series
+    calm_count = np.count_nonzero(speed < 0.5)
+
     stats = {
-        "mean_speed": wind_speed_clean.mean(),
-        "max_speed": wind_speed_clean.max(),
-        "min_speed": wind_speed_clean.min(),
-        "std_speed": wind_speed_clean.std(),
-        "median_speed": wind_speed_clean.median(),
-        "mean_direction": _calculate_mean_direction(wind_direction_clean),
-        "std_direction": _calculate_direction_std(wind_direction_clean),
-        "calm_percentage": (wind_speed_clean < 0.5).mean() * 100,
-        "data_count": len(wind_speed_clean),
+        "mean_speed": speed.mean(),
+        "max_speed": speed.max(),
+        "min_speed": speed.min(),
+        "std_speed": speed.std(ddof=1) if count > 1 else np.nan,
+        "median_speed": np.median(speed),
+        "mean_direction": mean_direction,
+        "std_direction": std_direction,
+        "calm_percentage": calm_count / count * 100,
+        "data_count": count,
     }
 
     return stats
 
 
-def _calculate_mean_direction(wind_direction: pd.Series) -> float:
-    """Calculate mean wind direction using vector averaging."""
-    # Convert to radians
-    direction_rad = np.radians(wind_direction)
-
-    # Calculate vector components
-    u = np.mean(np.cos(direction_rad))
-    v = np.mean(np.sin(direction_rad))
-
-    # Calculate mean direction
+def _circular_mean_and_std(
+    u: np.ndarray, v: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mean direction (0-360) and circular standard deviation, both in degrees,
+    from the mean cosine (u) and sine (v) components of the directions.
+    """
+    # Calculate mean direction, shifted into the 0-360 range
     mean_direction = np.degrees(np.arctan2(v, u))
+    mean_direction = np.where(mean_direction < 0, mean_direction + 360, mean_direction)
 
-    # Ensure result is in 0-360 range
-    if mean_direction < 0:
-        mean_direction += 360
+    # Calculate circular standard deviation from the resultant length
+    r = np.sqrt(u**2 + v**2)
+    with np.errstate(divide="ignore"):
+        std_direction = np.where(r > 0, np.sqrt(-2 * np.log(r)), np.inf)
 
-    return mean_direction
+    return mean_direction, np.degrees(std_direction)
 
 
-def _calculate_direction_std(wind_direction: pd.Series) -> float:
-    """Calculate standard deviation of wind direction."""
-    # Convert to radians
+def _calculate_direction_stats(wind_direction: np.ndarray) -> Tuple[float, float]:
+    """Calculate mean wind direction and its circular standard deviation."""
+    # Convert to radians and calculate the vector components in one pass
     direction_rad = np.radians(wind_direction)
-
-    # Calculate vector components
     u = np.mean(np.cos(direction_rad))
     v = np.mean(np.sin(direction_rad))
 
-    # Calculate resultant length
-    r = np.sqrt(u**2 + v**2)
-
-    # Calculate circular standard deviation
-    if r > 0:
-        std_direction = np.sqrt(-2 * np.log(r))
-    else:
-        std_direction = np.inf
-
-    return np.degrees(std_direction)
+    mean_direction, std_direction = _circular_mean_and_std(u, v)
+    return float(mean_direction), float(std_direction)
 
 
 def analyze_wind_resource(
@@ -399,11 +484,14 @@ def _fit_weibull_distribution(wind_speed: pd.Series) -> Dict[str, float]:
         k = np.nan
         c = np.nan
 
-    # Calculate R-squared (simplified)
+    # Calculate R-squared of the fitted CDF against the empirical CDF
+    # (Hazen plotting positions), which is deterministic
     if not np.isnan(k) and not np.isnan(c):
-        # Generate theoretical Weibull distribution
-        theoretical = np.random.weibull(k, len(wind_speed_clean)) * c
-        r_squared = np.corrcoef(wind_speed_clean, theoretical)[0, 1] ** 2
+        sorted_speed = np.sort(wind_speed_clean.to_numpy(dtype=float))
+        n = len(sorted_speed)
+        empirical_cdf = (np.arange(1, n + 1) - 0.5) / n
+        theoretical_cdf = 1 - np.exp(-((sorted_speed / c) ** k))
+        r_squared = np.corrcoef(empirical_cdf, theoretical_cdf)[0, 1] ** 2
     else:
         r_squared = np.nan
 
@@ -414,6 +502,16 @@ def _calculate_power_density(
     wind_speed: pd.Series, air_density: float = 1.225
 ) -> float:
     """Calculate wind power density."""
-    # Power density = 0.5 * air_density * wind_speed^3
-    power_density = 0.5 * air_density * (wind_speed**3).mean()
+    # Missing speeds are skipped, as Series.mean() would
+    speed = wind_speed.to_numpy(dtype=np.float64)
+    missing = np.isnan(speed)
+    if missing.any():
+        speed = speed[~missing]
+    if len(speed) == 0:
+        return np.nan
+
+    # Power density = 0.5 * air_density * mean(wind_speed^3); einsum sums
+    # the triple product in one pass without a cubed temporary
+    mean_cube = np.einsum("i,i,i->", speed, speed, speed) / len(speed)
+    power_density = 0.5 * air_density * mean_cube
     return power_density
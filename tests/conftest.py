@@ -10,15 +10,19 @@ from pathlib import Path
 from climate_utils.epw import load_epw_to_df
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sf_epw_file():
     """Path to the San Francisco EPW file."""
     return Path(__file__).parent / "USA_CA_San.Francisco.Intl.AP.724940_TMYx.epw"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sf_epw_data(sf_epw_file):
-    """Load San Francisco EPW data as a processed DataFrame with location info."""
+    """Load San Francisco EPW data as a processed DataFrame with location info.
+
+    The frame is parsed once per session and shared, so tests must treat it
+    as read-only and take a ``.copy()`` before modifying it.
+    """
     from climate_utils.epw import load_epw_with_location
 
     df, lat, lon, tz = load_epw_with_location(sf_epw_file, year=2023)
@@ -28,15 +32,40 @@ def sf_epw_data(sf_epw_file):
     return df
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sf_solar_angles(sf_epw_data):
+    """Solar (zenith, azimuth) angles for the San Francisco data at its EPW location."""
+    from climate_utils.solar import calculate_solar_angles_epw
+
+    return calculate_solar_angles_epw(sf_epw_data)
+
+
+@pytest.fixture(scope="session")
+def sf_wind_analysis(sf_epw_data):
+    """Wind resource analysis of the San Francisco data at 80 m hub height."""
+    from climate_utils.wind_analysis import analyze_wind_resource
+
+    return analyze_wind_resource(
+        wind_speed=sf_epw_data["Wind Speed (m/s)"],
+        wind_direction=sf_epw_data["Wind Direction (°)"],
+        height=10.0,
+        target_height=80.0,
+        shear_coefficient=0.14,
+    )
+
+
+@pytest.fixture(scope="session")
 def sharm_epw_file():
     """Path to the Sharm El Sheikh EPW file."""
     return Path(__file__).parent / "EGY_JS_Sharm.Sheikh.Intl.AP.624639_TMYx.epw"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sharm_epw_data(sharm_epw_file):
-    """Load Sharm El Sheikh EPW data as a processed DataFrame with location info."""
+    """Load Sharm El Sheikh EPW data as a processed DataFrame with location info.
+
+    Shared across the session like ``sf_epw_data``; do not modify in place.
+    """
     from climate_utils.epw import load_epw_with_location
 
     df, lat, lon, tz = load_epw_with_location(sharm_epw_file, year=2023)
@@ -46,6 +75,14 @@ def sharm_epw_data(sharm_epw_file):
     return df
 
 
+@pytest.fixture(scope="session")
+def sharm_solar_angles(sharm_epw_data):
+    """Solar (zenith, azimuth) angles for the Sharm El Sheikh data at its location."""
+    from climate_utils.solar import calculate_solar_angles_epw
+
+    return calculate_solar_angles_epw(sharm_epw_data)
+
+
 @pytest.fixture
 def sf_epw_raw(sf_epw_file):
     """Load San Francisco EPW data as a raw EPW object."""
@@ -5,7 +5,16 @@ Tests for EPW module functionality.
 import pytest
 import pandas as pd
 import numpy as np
-from climate_utils.epw import load_epw, load_epw_to_df, epw_to_df
+from climate_utils.epw import (
+    load_epw,
+    load_epw_to_df,
+    load_epw_with_location,
+    load_epws_to_dfs,
+    epw_to_df,
+    create_blank_epw,
+    update_epw_column,
+    get_epw_datetime_index,
+)
 
 
 class TestEPW:
@@ -51,3 +60,119 @@ class TestEPW:
         assert len(df) == 3
         assert df["col1"].sum() == 6
         assert df["col2"].mean() == 5.0
+
+    def test_create_blank_epw(self):
+        """Test that a blank EPW has a full year of zeroed hourly data."""
+        epw = create_blank_epw()
+
+        dry_bulb = list(epw.dry_bulb_temperature.values)
+        assert len(dry_bulb) == 8760
+        assert all(value == 0 for value in dry_bulb)
+        assert all(value == 101325 for value in epw.atmospheric_station_pressure.values)
+
+    def test_epw_to_df_rejects_invalid_relative_humidity(self):
+        """Test that out-of-range RH values raise a ValueError."""
+        epw = create_blank_epw()
+        rh = pd.Series(np.full(8760, 50.0))
+        rh.iloc[10] = 150.0
+        update_epw_column(epw, "Relative Humidity", rh)
+
+        with pytest.raises(ValueError, match="Invalid RH values"):
+            epw_to_df(epw)
+
+        rh.iloc[10] = np.nan
+        update_epw_column(epw, "Relative Humidity", rh)
+
+        with pytest.raises(ValueError, match="Invalid RH values"):
+            epw_to_df(epw)
+
+    def test_update_epw_column(self):
+        """Test updating an EPW column by name and rejecting unknown names."""
+        epw = create_blank_epw()
+        update_epw_column(epw, "Dry Bulb Temperature", pd.Series(np.full(8760, 12.5)))
+
+        assert epw.dry_bulb_temperature.values[0] == pytest.approx(12.5)
+        assert epw.dry_bulb_temperature.values[-1] == pytest.approx(12.5)
+
+        with pytest.raises(ValueError, match="not a valid EPW column"):
+            update_epw_column(epw, "Not A Column", pd.Series(np.zeros(8760)))
+
+    def test_load_epw_fast_backend_matches_ladybug(self, sf_epw_file):
+        """Test that the read_csv backend reproduces the ladybug DataFrame."""
+        df_ladybug, *location_ladybug = load_epw_with_location(sf_epw_file, year=2023)
+        df_fast, *location_fast = load_epw_with_location(
+            sf_epw_file, year=2023, backend="fast"
+        )
+
+        pd.testing.assert_frame_equal(df_fast, df_ladybug)
+        assert location_fast == location_ladybug
+
+    def test_load_epw_invalid_backend(self, sf_epw_file):
+        """Test that an unknown backend is rejected."""
+        with pytest.raises(ValueError, match="backend"):
+            load_epw_to_df(sf_epw_file, backend="pyarrow")
+
+    def test_update_epw_column_from_array(self):
+        """Test updating an EPW column from a NumPy array."""
+        epw = create_blank_epw()
+        update_epw_column(epw, "Wind Speed", np.full(8760, 3.5))
+
+        assert type(epw.wind_speed.values[0]) is float
+        assert epw.wind_speed.values[100] == pytest.approx(3.5)
+
+        with pytest.raises(ValueError, match="you provided 10"):
+            update_epw_column(epw, "Wind Speed", np.zeros(10))
+
+    @pytest.mark.parametrize("backend", ["ladybug", "fast"])
+    def test_load_epw_column_subset(self, sf_epw_file, backend):
+        """Test loading only a subset of columns skips unrelated derived columns."""
+        df = load_epw_to_df(
+            sf_epw_file,
+            backend=backend,
+            columns=["Wind Speed (m/s)", "Wind Direction (°)"],
+        )
+        assert list(df.columns) == [
+            "Wind Speed (m/s)",
+            "Wind Direction (°)",
+            "Sector",
+            "2 Sector",
+        ]
+        assert len(df) == 8760
+
+        with pytest.raises(ValueError, match="Unknown EPW columns"):
+            load_epw_to_df(sf_epw_file, backend=backend, columns=["Wind Gust"])
+
+    def test_load_epw_fast_backend_single_column(self, sf_epw_file):
+        """Test the fast backend can load one column, which it edits in place."""
+        df = load_epw_to_df(sf_epw_file, backend="fast", columns=["Wind Speed (m/s)"])
+        expected = load_epw_to_df(sf_epw_file, columns=["Wind Speed (m/s)"])
+
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_epw_datetime_index_is_not_shared(self, sf_epw_file):
+        """Test renaming one frame's index does not leak into later loads."""
+        df = load_epw_to_df(sf_epw_file, backend="fast")
+        df.index.name = "time"
+
+        assert load_epw_to_df(sf_epw_file, backend="fast").index.name is None
+        assert get_epw_datetime_index(None).name is None
+
+    def test_load_epw_leap_year_rejected(self, sf_epw_file):
+        """Test a leap year does not silently shift the 8760-hour data."""
+        with pytest.raises(ValueError):
+            load_epw_to_df(sf_epw_file, year=2020, backend="fast")
+
+    def test_load_epws_to_dfs(self, sf_epw_file, sharm_epw_file):
+        """Test parallel batch loading matches sequential loading, in order."""
+        paths = [sf_epw_file, sharm_epw_file]
+        dfs = load_epws_to_dfs(paths, year=2023, backend="fast", max_workers=2)
+
+        assert len(dfs) == 2
+        for path, df in zip(paths, dfs):
+            pd.testing.assert_frame_equal(
+                df, load_epw_to_df(path, year=2023, backend="fast")
+            )
+
+        columns = ["Wind Speed (m/s)"]
+        dfs = load_epws_to_dfs(paths, backend="fast", max_workers=2, columns=columns)
+        assert [list(df.columns) for df in dfs] == [columns, columns]
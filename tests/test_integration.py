@@ -4,6 +4,8 @@ Integration tests for climate-utils using real EPW data.
 These tests verify that all modules work together correctly with actual weather data.
 """
 
+import logging
+
 import pytest
 import pandas as pd
 import numpy as np
@@ -21,10 +23,44 @@ from climate_utils import (
     create_state_point_from_epw,
 )
 
+logger = logging.getLogger(__name__)
+
+_VALID_SECTORS = frozenset(
+    {
+        "N",
+        "NNE",
+        "NE",
+        "ENE",
+        "E",
+        "ESE",
+        "SE",
+        "SSE",
+        "S",
+        "SSW",
+        "SW",
+        "WSW",
+        "W",
+        "WNW",
+        "NW",
+        "NNW",
+    }
+)
+
 
 class TestIntegration:
     """Integration tests using real EPW data."""
 
+    def test_package_exports(self):
+        """Test that every name in __all__ resolves exactly once."""
+        import climate_utils
+
+        assert len(climate_utils.__all__) == len(set(climate_utils.__all__))
+        for name in climate_utils.__all__:
+            assert getattr(climate_utils, name) is not None
+
+        with pytest.raises(AttributeError):
+            climate_utils.not_a_real_attribute
+
     def test_epw_loading_and_processing(self, sf_epw_data):
         """Test that EPW file loads and processes correctly."""
         # Check basic structure
@@ -57,30 +93,9 @@ class TestIntegration:
         assert sf_epw_data["Enthalpy (J/kg)"].min() > 0
 
         # Check wind sectors
-        assert all(
-            sector
-            in [
-                "N",
-                "NNE",
-                "NE",
-                "ENE",
-                "E",
-                "ESE",
-                "SE",
-                "SSE",
-                "S",
-                "SSW",
-                "SW",
-                "WSW",
-                "W",
-                "WNW",
-                "NW",
-                "NNW",
-            ]
-            for sector in sf_epw_data["Sector"].unique()
-        )
+        assert sf_epw_data["Sector"].isin(_VALID_SECTORS).all()
 
-    def test_wind_analysis_integration(self, sf_epw_data):
+    def test_wind_analysis_integration(self, sf_epw_data, sf_wind_analysis):
         """Test wind analysis with real EPW data."""
         wind_speed = sf_epw_data["Wind Speed (m/s)"]
         wind_direction = sf_epw_data["Wind Direction (°)"]
@@ -93,13 +108,12 @@ class TestIntegration:
         assert isinstance(adjusted_speed, pd.Series)
         assert len(adjusted_speed) == 8760
         # Check that non-zero wind speeds are increased at higher elevation
-        non_zero_mask = wind_speed > 0
-        if non_zero_mask.any():
-            assert all(adjusted_speed[non_zero_mask] > wind_speed[non_zero_mask])
+        speed = wind_speed.to_numpy()
+        adjusted = adjusted_speed.to_numpy()
+        non_zero_mask = speed > 0
+        assert np.all(adjusted[non_zero_mask] > speed[non_zero_mask])
         # Check that zero wind speeds remain zero
-        zero_mask = wind_speed == 0
-        if zero_mask.any():
-            assert all(adjusted_speed[zero_mask] == 0)
+        assert np.all(adjusted[speed == 0] == 0)
 
         # Test wind direction mapping
         sectors = map_wind_direction_to_sector(wind_direction, num_sectors=16)
@@ -107,13 +121,7 @@ class TestIntegration:
         assert len(sectors) == 8760
 
         # Test advanced wind analysis
-        wind_analysis_results = wind_analysis.analyze_wind_resource(
-            wind_speed=wind_speed,
-            wind_direction=wind_direction,
-            height=10.0,
-            target_height=80.0,
-            shear_coefficient=0.14,
-        )
+        wind_analysis_results = sf_wind_analysis
 
         assert isinstance(wind_analysis_results, dict)
         assert "basic_statistics" in wind_analysis_results
@@ -144,7 +152,8 @@ class TestIntegration:
             assert key in solar_results
             assert isinstance(solar_results[key], pd.Series)
             assert len(solar_results[key]) == 8760
-            assert all(solar_results[key] >= 0)  # Irradiation should be non-negative
+            # Irradiation should be non-negative
+            assert (solar_results[key].to_numpy() >= 0).all()
 
     def test_state_point_integration(self, sf_epw_data):
         """Test state point analysis with real EPW data."""
@@ -163,7 +172,7 @@ class TestIntegration:
         assert (state_points.relative_humidity >= 0.0 - eps).all()
 
         # Test with a subset of data for detailed analysis
-        subset_data = sf_epw_data.head(100)
+        subset_data = sf_epw_data.iloc[:100]
         subset_state_points = create_state_point_from_epw(subset_data)
 
         assert len(subset_state_points.dry_bulb_temp) == 100
@@ -176,7 +185,7 @@ class TestIntegration:
         assert "humidity_ratio" in df.columns
         assert "enthalpy" in df.columns
 
-    def test_full_workflow_integration(self, sf_epw_data):
+    def test_full_workflow_integration(self, sf_epw_data, sf_wind_analysis):
         """Test complete workflow from EPW data to final analysis."""
         # Step 1: Load and process EPW data
         assert len(sf_epw_data) == 8760
@@ -184,13 +193,8 @@ class TestIntegration:
         # Step 2: Create state points
         state_points = create_state_point_from_epw(sf_epw_data)
 
-        # Step 3: Analyze wind
-        wind_results = wind_analysis.analyze_wind_resource(
-            wind_speed=sf_epw_data["Wind Speed (m/s)"],
-            wind_direction=sf_epw_data["Wind Direction (°)"],
-            height=10.0,
-            target_height=80.0,
-        )
+        # Step 3: Analyze wind (shared session result)
+        wind_results = sf_wind_analysis
 
         # Step 4: Analyze solar
         solar_results = get_surface_irradiation_orientations_epw(
@@ -254,40 +258,43 @@ class TestIntegration:
         )
 
         # Check that enthalpy increases with temperature (generally)
-        temp_enthalpy_corr = temp.corr(state_points.enthalpy)
+        temp_enthalpy_corr = np.corrcoef(
+            temp.to_numpy(), state_points.enthalpy.to_numpy()
+        )[0, 1]
         assert temp_enthalpy_corr > 0.5  # Should be strongly correlated
 
+    @pytest.mark.perf
     def test_performance_with_large_dataset(self, sf_epw_data):
-        """Test performance with the full 8760-hour dataset."""
-        import time
-
-        # Test wind analysis performance
-        start_time = time.time()
-        wind_results = wind_analysis.analyze_wind_resource(
-            wind_speed=sf_epw_data["Wind Speed (m/s)"],
-            wind_direction=sf_epw_data["Wind Direction (°)"],
-            height=10.0,
-            target_height=80.0,
-        )
-        wind_time = time.time() - start_time
-
-        # Test solar analysis performance
-        start_time = time.time()
-        solar_results = get_surface_irradiation_orientations_epw(
-            sf_epw_data, orientations=[0, 90, 180, 270]
-        )
-        solar_time = time.time() - start_time
-
-        # Test state point creation performance
-        start_time = time.time()
-        state_points = create_state_point_from_epw(sf_epw_data)
-        state_time = time.time() - start_time
-
-        # All operations should complete in reasonable time (< 10 seconds each)
-        assert wind_time < 10.0, f"Wind analysis took {wind_time:.2f}s"
-        assert solar_time < 10.0, f"Solar analysis took {solar_time:.2f}s"
-        assert state_time < 10.0, f"State point creation took {state_time:.2f}s"
-
-        print(
-            f"Performance: Wind={wind_time:.2f}s, Solar={solar_time:.2f}s, State={state_time:.2f}s"
+        """Report steady-state timings for the full 8760-hour dataset.
+
+        Wall-clock budgets are machine dependent, so the timings are logged
+        rather than asserted. Each step runs once untimed first, so one-time
+        costs (imports, numba JIT, memoized solar position) are excluded.
+        """
+        from time import perf_counter_ns
+
+        steps = {
+            "wind": lambda: wind_analysis.analyze_wind_resource(
+                wind_speed=sf_epw_data["Wind Speed (m/s)"],
+                wind_direction=sf_epw_data["Wind Direction (°)"],
+                height=10.0,
+                target_height=80.0,
+            ),
+            "solar": lambda: get_surface_irradiation_orientations_epw(
+                sf_epw_data, orientations=[0, 90, 180, 270]
+            ),
+            "state point": lambda: create_state_point_from_epw(sf_epw_data),
+        }
+
+        timings_ms = {}
+        for name, step in steps.items():
+            step()  # warm up
+            start_time = perf_counter_ns()
+            result = step()
+            timings_ms[name] = (perf_counter_ns() - start_time) / 1e6
+            assert result is not None
+
+        logger.info(
+            "Performance: %s",
+            ", ".join(f"{name}={ms:.1f} ms" for name, ms in timings_ms.items()),
         )
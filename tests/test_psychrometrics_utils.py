@@ -0,0 +1,115 @@
+"""
+Tests for psychrometrics_utils module functionality.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import psychrolib
+from climate_utils.psychrometrics_utils import (
+    series_humidity_ratio,
+    series_enthalpy_air,
+    _humidity_ratio_and_enthalpy,
+)
+
+psychrolib.SetUnitSystem(psychrolib.SI)
+
+
+class TestPsychrometricsUtils:
+    """Test cases for psychrometric utility functions."""
+
+    def test_fused_kernel_matches_psychrolib(self):
+        """Test the vectorized kernel against psychrolib's scalar functions."""
+        # Span both sides of the triple point and the full RH range
+        temps = np.array([-30.0, -5.0, 0.0, 0.01, 0.02, 15.0, 25.0, 45.0])
+        rh = np.array([0.0, 20.0, 50.0, 75.0, 100.0, 60.0, 35.0, 10.0])
+        pressure = np.array([101325.0] * 4 + [95000.0] * 4)
+
+        humidity_ratio, enthalpy = _humidity_ratio_and_enthalpy(temps, rh, pressure)
+
+        for i in range(len(temps)):
+            expected_w = psychrolib.GetHumRatioFromRelHum(
+                temps[i], rh[i] / 100.0, pressure[i]
+            )
+            expected_h = psychrolib.GetMoistAirEnthalpy(temps[i], expected_w)
+            assert humidity_ratio[i] == pytest.approx(expected_w * 1000, rel=1e-12)
+            assert enthalpy[i] == pytest.approx(expected_h, rel=1e-12)
+
+    def test_fused_kernel_validation(self):
+        """Test that out-of-range inputs raise like psychrolib does."""
+        with pytest.raises(ValueError):
+            _humidity_ratio_and_enthalpy(
+                np.array([20.0]), np.array([120.0]), np.array([101325.0])
+            )
+
+        with pytest.raises(ValueError):
+            _humidity_ratio_and_enthalpy(
+                np.array([250.0]), np.array([50.0]), np.array([101325.0])
+            )
+
+    def test_series_functions(self):
+        """Test the Series wrappers return values indexed like the input."""
+        temps = pd.Series([20.0, 25.0, 30.0], index=[10, 20, 30])
+        rh = pd.Series([50.0, 60.0, 70.0], index=[10, 20, 30])
+
+        humidity_ratio = series_humidity_ratio(temps, rh)
+        enthalpy = series_enthalpy_air(temps, rh)
+
+        assert isinstance(humidity_ratio, pd.Series)
+        assert isinstance(enthalpy, pd.Series)
+        assert list(humidity_ratio.index) == [10, 20, 30]
+        assert humidity_ratio.iloc[0] == pytest.approx(
+            psychrolib.GetHumRatioFromRelHum(20.0, 0.5, 101325.0) * 1000
+        )
+        assert (enthalpy > 0).all()
+
+        with pytest.raises(TypeError):
+            series_humidity_ratio([20.0], rh)
+
+    def test_series_humidity_ratio_matches_psychrolib(self):
+        """Test the vectorized humidity ratio against psychrolib row by row."""
+        temps = pd.Series([-10.0, 0.0, 12.5, 30.0])
+        rh = pd.Series([80.0, 100.0, 45.0, 5.0])
+        pressure = pd.Series([101325.0, 100000.0, 98000.0, 90000.0])
+
+        for p in (None, 95000, pressure):
+            result = series_humidity_ratio(temps, rh, p)
+            p_values = (
+                [101325.0] * 4
+                if p is None
+                else ([float(p)] * 4 if np.isscalar(p) else list(p))
+            )
+            for t, r, pv, w in zip(temps, rh, p_values, result):
+                expected = psychrolib.GetHumRatioFromRelHum(t, r / 100.0, pv)
+                assert w == pytest.approx(expected * 1000, rel=1e-12)
+
+        with pytest.raises(TypeError):
+            series_humidity_ratio(temps, rh, "101325")
+
+    def test_series_enthalpy_air_matches_psychrolib(self):
+        """Test the vectorized enthalpy against psychrolib row by row."""
+        temps = pd.Series([-10.0, 0.0, 12.5, 30.0], index=list("abcd"))
+        rh = pd.Series([80.0, 100.0, 45.0, 5.0], index=list("abcd"))
+
+        result = series_enthalpy_air(temps, rh, 98000.0)
+
+        assert list(result.index) == list("abcd")
+        for t, r, h in zip(temps, rh, result):
+            w = psychrolib.GetHumRatioFromRelHum(t, r / 100.0, 98000.0)
+            expected = psychrolib.GetMoistAirEnthalpy(t, w)
+            assert h == pytest.approx(expected, rel=1e-12)
+
+    def test_series_pressure_broadcasting(self):
+        """Test scalar and ndarray pressures broadcast like an aligned Series."""
+        temps = pd.Series([5.0, 20.0, 35.0])
+        rh = pd.Series([30.0, 60.0, 90.0])
+        expected = series_humidity_ratio(temps, rh, pd.Series([95000.0] * 3))
+
+        pressures = (95000, np.float64(95000.0), np.int64(95000), np.full(3, 95000.0))
+        for pressure in pressures:
+            pd.testing.assert_series_equal(
+                series_humidity_ratio(temps, rh, pressure), expected
+            )
+
+        with pytest.raises(ValueError):
+            series_enthalpy_air(temps, rh, np.full(2, 95000.0))
@@ -104,6 +104,22 @@ class TestStatePoint:
         assert all(sp.relative_humidity <= 1.0)  # Should be converted to fraction
         assert sp.relative_humidity.iloc[0] == pytest.approx(0.5)  # 50% = 0.5
 
+    def test_create_state_point_from_epw_with_missing_rh(self):
+        """Test a missing RH value does not skip the percent conversion."""
+        df_epw = pd.DataFrame(
+            {
+                "Dry Bulb Temperature (°C)": [20, 25, 30],
+                "Relative Humidity (%)": [50, np.nan, 70],
+            }
+        )
+
+        sp = create_state_point_from_epw(df_epw)
+
+        assert sp.relative_humidity.iloc[0] == pytest.approx(0.5)
+        assert sp.relative_humidity.iloc[2] == pytest.approx(0.7)
+        assert np.isnan(sp.relative_humidity.iloc[1])
+        assert sp.humidity_ratio.iloc[[0, 2]].between(0, 0.05).all()
+
     def test_create_state_point_from_epw_alt_names(self):
         """Test creating StatePoint from EPW data with alternative column names."""
         # Test with alternative column names
@@ -143,3 +159,93 @@ class TestStatePoint:
         # Pressure should be lower at altitude
         assert sp.pressure.iloc[0] < 101325.0  # Sea level pressure
         assert sp.pressure.iloc[0] > 80000.0  # Reasonable lower bound
+
+    def test_state_point_dry_air(self):
+        """Test the dry-air default skips the vapor chain without warnings."""
+        import warnings
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            sp = StatePoint(dry_bulb_temp=pd.Series([10.0, 25.0]))
+
+        assert (sp.humidity_ratio == 0).all()
+        assert (sp.relative_humidity == 0).all()
+        assert sp.dew_point_temp.isna().all()
+        assert sp.enthalpy.tolist() == pytest.approx([10.06, 25.15])
+
+    def test_state_point_pressure_scalar_and_series(self):
+        """Test scalar and Series pressures give the same properties."""
+        temps = pd.Series([15.0, 25.0, 35.0], index=[3, 4, 5])
+        scalar = StatePoint(temps, relative_humidity=0.5, pressure=95000.0)
+        series = StatePoint(
+            temps, relative_humidity=0.5, pressure=pd.Series(95000.0, index=temps.index)
+        )
+
+        pd.testing.assert_frame_equal(scalar.to_dataframe(), series.to_dataframe())
+        assert list(scalar.pressure.index) == [3, 4, 5]
+        assert (scalar.pressure == 95000.0).all()
+
+    def test_state_point_pressure_series_and_setter(self):
+        """Test Series pressure aligns by index and pressure stays assignable."""
+        temps = pd.Series([15.0, 25.0], index=["a", "b"])
+        pressure = pd.Series([90000.0, 100000.0], index=["b", "a"])
+        sp = StatePoint(temps, relative_humidity=0.5, pressure=pressure)
+
+        assert sp.pressure.tolist() == [100000.0, 90000.0]
+        reference = StatePoint(25.0, relative_humidity=0.5, pressure=90000.0)
+        assert sp.humidity_ratio["b"] == pytest.approx(reference.humidity_ratio.iloc[0])
+
+        sp.pressure.iloc[0] = 95000.0  # writable
+        sp.pressure = 80000.0
+        assert sp.pressure.tolist() == [80000.0, 80000.0]
+        assert list(sp.pressure.index) == ["a", "b"]
+
+    def test_state_point_from_arrays_with_index(self):
+        """Test array inputs match Series inputs and keep the given index."""
+        index = pd.date_range("2023-01-01", periods=3, freq="h")
+        temps = pd.Series([20.0, 25.0, 30.0], index=index)
+        rh = pd.Series([0.5, 0.6, 0.7], index=index)
+
+        from_series = StatePoint(temps, relative_humidity=rh)
+        from_arrays = StatePoint(
+            temps.to_numpy(), relative_humidity=rh.to_numpy(), index=index
+        )
+
+        pd.testing.assert_frame_equal(
+            from_arrays.to_dataframe(), from_series.to_dataframe()
+        )
+
+        df_epw = pd.DataFrame(
+            {"Dry Bulb Temperature (°C)": temps, "Relative Humidity (%)": rh * 100}
+        )
+        sp = create_state_point_from_epw(df_epw)
+        assert sp.to_dataframe().index.equals(index)
+
+    def test_state_point_properties_are_lazy(self):
+        """Test derived properties are only computed when accessed."""
+        sp = StatePoint(pd.Series([20.0, 30.0]), relative_humidity=0.5)
+
+        enthalpy = sp.enthalpy
+        assert sp._relative_humidity is None
+        assert sp._dew_point_temp is None
+        assert sp.enthalpy is enthalpy  # cached
+
+        df = sp.to_dataframe()
+        assert not df.isna().any().any()
+        assert sp.relative_humidity.tolist() == pytest.approx([0.5, 0.5])
+
+    def test_state_point_wet_bulb_round_trip(self):
+        """Test the iterative wet bulb inverts the wet bulb humidity ratio."""
+        temps = pd.Series([-5.0, 10.0, 25.0, 40.0])
+        sp = StatePoint(temps, relative_humidity=pd.Series([0.9, 0.2, 0.6, 0.1]))
+        wet_bulb = sp.wet_bulb_temp
+
+        assert (wet_bulb <= temps).all()
+        assert StatePoint(25.0, relative_humidity=1.0).wet_bulb_temp.iloc[
+            0
+        ] == pytest.approx(25.0)
+
+        round_trip = StatePoint(temps, wet_bulb_temp=wet_bulb)
+        np.testing.assert_allclose(
+            round_trip.humidity_ratio, sp.humidity_ratio, rtol=0, atol=1e-12
+        )
@@ -0,0 +1,54 @@
+"""
+Tests for types module functionality.
+"""
+
+import json
+
+import pytest
+import pandas as pd
+from climate_utils.types import (
+    REQUIRED_EPW_COLUMNS,
+    get_epw_column_info,
+    validate_epw_dataframe,
+)
+
+
+class TestTypes:
+    """Test cases for DataFrame type validation."""
+
+    def test_validate_epw_dataframe_basic(self, sample_weather_data):
+        """Test validation passes for a DataFrame with the basic columns."""
+        validate_epw_dataframe(sample_weather_data)
+        validate_epw_dataframe(sample_weather_data, REQUIRED_EPW_COLUMNS["solar"])
+
+    def test_validate_epw_dataframe_missing_columns(self, sample_weather_data):
+        """Test validation reports missing columns in required order."""
+        df = sample_weather_data.drop(
+            columns=["Wind Speed (m/s)", "Relative Humidity (%)"]
+        )
+
+        with pytest.raises(ValueError) as exc_info:
+            validate_epw_dataframe(df, REQUIRED_EPW_COLUMNS["basic"])
+
+        assert "['Relative Humidity (%)', 'Wind Speed (m/s)']" in str(exc_info.value)
+
+    def test_validate_epw_dataframe_type_error(self):
+        """Test validation rejects non-DataFrame input."""
+        with pytest.raises(TypeError):
+            validate_epw_dataframe({"Wind Speed (m/s)": [1, 2, 3]})
+
+    def test_required_columns_are_immutable(self):
+        """Test the shared required-column definitions cannot be mutated."""
+        for columns in REQUIRED_EPW_COLUMNS.values():
+            assert isinstance(columns, tuple)
+
+    def test_epw_column_info_returns_independent_dicts(self):
+        """Test the column info is a plain dict that callers may modify."""
+        info = get_epw_column_info()
+
+        assert isinstance(info, dict)
+        assert info["Wind Speed (m/s)"]["unit"] == "m/s"
+        json.dumps(info)
+
+        info["Wind Speed (m/s)"]["unit"] = "km/h"
+        assert get_epw_column_info()["Wind Speed (m/s)"]["unit"] == "m/s"
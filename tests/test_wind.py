@@ -124,6 +124,17 @@ class TestWind:
         sectors = map_wind_direction_to_sector(directions, 8)
         assert sectors.iloc[0] == "NW"
 
+        # Directions just below 360 belong to the North sector
+        directions = pd.Series([348.75, 350, 359.9])
+        sectors = map_wind_direction_to_sector(directions, 16)
+        assert list(sectors) == ["N", "N", "N"]
+
+        # Missing directions stay missing
+        directions = pd.Series([90, np.nan])
+        sectors = map_wind_direction_to_sector(directions, 4)
+        assert sectors.iloc[0] == "E"
+        assert pd.isna(sectors.iloc[1])
+
     def test_map_wind_direction_validation(self):
         """Test wind direction mapping validation."""
         # Test invalid number of sectors
@@ -135,3 +146,12 @@ class TestWind:
         # Test non-Series input
         with pytest.raises(TypeError):
             map_wind_direction_to_sector([0, 90, 180, 270], 8)
+
+    def test_adjust_wind_speed_same_height(self):
+        """Test equal heights return the input values without scaling."""
+        speeds = pd.Series([2.0, 5.0, 8.0], name="speed")
+        adjusted = adjust_wind_speed(speeds, 10, 10, 0.14)
+
+        assert adjusted is not speeds
+        pd.testing.assert_series_equal(adjusted, speeds)
+        assert adjust_wind_speed(5.0, 10, 10, 0.14) == 5.0
@@ -0,0 +1,126 @@
+"""
+Tests for wind_analysis module functionality.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from climate_utils.wind_analysis import (
+    _calculate_power_density,
+    _fit_weibull_distribution,
+    calculate_wind_rose_data,
+    calculate_wind_statistics,
+    map_wind_direction_to_sector,
+)
+
+
+class TestWindAnalysis:
+    """Test cases for wind analysis functionality."""
+
+    def test_map_wind_direction_to_sector_series(self):
+        """Test Series directions map to categorical sector labels."""
+        directions = pd.Series([0.0, 22.4, 22.5, 90.0, 348.75, 360.0, -22.5])
+        sectors = map_wind_direction_to_sector(directions)
+
+        assert isinstance(sectors.dtype, pd.CategoricalDtype)
+        assert list(sectors.cat.categories)[:4] == ["N", "NNE", "NE", "ENE"]
+        assert sectors.tolist() == ["N", "N", "NNE", "E", "NNW", "N", "NNW"]
+        assert sectors.index.equals(directions.index)
+
+    def test_map_wind_direction_to_sector_missing_and_custom(self):
+        """Test missing directions and repeated custom sector names."""
+        sectors = map_wind_direction_to_sector(pd.Series([np.nan, 90.0]), 4)
+        assert pd.isna(sectors.iloc[0])
+        assert sectors.iloc[1] == "E"
+
+        sectors = map_wind_direction_to_sector(
+            pd.Series([10.0, 200.0, 300.0]), 3, ["calm", "calm", "windy"]
+        )
+        assert sectors.tolist() == ["calm", "calm", "windy"]
+
+    def test_calculate_wind_rose_data_matches_groupby(self):
+        """Test the histogram equals a groupby count over the binned data."""
+        rng = np.random.default_rng(0)
+        speed = pd.Series(rng.uniform(0, 30, 2000))
+        direction = pd.Series(rng.uniform(0, 360, 2000))
+        speed.iloc[:10] = [np.nan, 0.0, 50.0, 60.0, 2.0, 4.0, 0, 0, 0, 0]
+        direction.iloc[10:15] = np.nan
+
+        wind_rose = calculate_wind_rose_data(speed, direction)
+
+        expected = (
+            pd.DataFrame(
+                {
+                    "sector": map_wind_direction_to_sector(direction).astype(object),
+                    "bin": pd.cut(
+                        speed,
+                        bins=[0, 2, 4, 6, 8, 10, 12, 15, 20, 25, 30, 50],
+                        labels=False,
+                        include_lowest=True,
+                    ),
+                }
+            )
+            .dropna()
+            .value_counts()
+        )
+        counts = wind_rose.set_index(["direction_sector", "speed_bin"])["count"]
+        assert counts.sum() == expected.sum()
+        for (sector, speed_bin), count in expected.items():
+            assert counts[(sector, int(speed_bin))] == count
+        assert wind_rose["frequency"].sum() == pytest.approx(
+            expected.sum() / len(speed) * 100
+        )
+        assert wind_rose.loc[0, "speed_label"] == "0-2"
+
+    def test_calculate_wind_statistics_by_period(self):
+        """Test grouped statistics match per-period statistics."""
+        index = pd.date_range("2023-01-01", periods=24 * 10, freq="h")
+        rng = np.random.default_rng(1)
+        speed = pd.Series(rng.uniform(0, 10, len(index)), index=index)
+        direction = pd.Series(rng.uniform(0, 360, len(index)), index=index)
+        speed.iloc[24:48] = np.nan  # no valid data on the second day
+        direction.iloc[::5] = np.nan
+
+        stats = calculate_wind_statistics(speed, direction, time_period="D")
+
+        assert not any(key.startswith("2023-01-02") for key in stats)
+        for day in ["2023-01-01", "2023-01-07"]:
+            expected = calculate_wind_statistics(speed.loc[day], direction.loc[day])
+            for key, value in expected.items():
+                assert stats[f"{day} 00:00:00_{key}"] == pytest.approx(value)
+
+    def test_fit_weibull_distribution_deterministic(self):
+        """Test the Weibull fit recovers known parameters reproducibly."""
+        rng = np.random.default_rng(2)
+        speed = pd.Series(rng.weibull(2.0, 5000) * 7.0)
+
+        params = _fit_weibull_distribution(speed)
+
+        assert params["shape"] == pytest.approx(2.0, rel=0.05)
+        assert params["scale"] == pytest.approx(7.0, rel=0.05)
+        assert 0.99 < params["r_squared"] <= 1.0
+        assert _fit_weibull_distribution(speed) == params
+
+    def test_map_wind_direction_to_sector_scalar(self):
+        """Test scalar directions map to a single sector name."""
+        assert map_wind_direction_to_sector(0.0) == "N"
+        assert map_wind_direction_to_sector(90) == "E"
+        assert map_wind_direction_to_sector(359.99) == "NNW"
+        assert map_wind_direction_to_sector(np.float64(725.0), 4) == "N"
+        assert pd.isna(map_wind_direction_to_sector(np.nan))
+
+    def test_calculate_wind_statistics_period_requires_datetime_index(self):
+        """Test grouping by period rejects data without timestamps."""
+        speed = pd.Series([1.0, 2.0, 3.0])
+        direction = pd.Series([0.0, 90.0, 180.0])
+
+        with pytest.raises(ValueError, match="DatetimeIndex"):
+            calculate_wind_statistics(speed, direction, time_period="D")
+
+    def test_calculate_power_density(self):
+        """Test power density matches the mean cubed speed, skipping NaN."""
+        speed = pd.Series([2.0, np.nan, 4.0, 6.0])
+
+        expected = 0.5 * 1.225 * (speed**3).mean()
+        assert _calculate_power_density(speed) == pytest.approx(expected)
+        assert np.isnan(_calculate_power_density(pd.Series([np.nan])))